@@ -13,6 +13,9 @@ Architecture note:
 
 from benchmarks.base import BenchmarkBase
 from benchmarks.zfs_pool import ZFSPoolBenchmark, POOL_BLOCK_SIZES
-from benchmarks.disk_enhanced import EnhancedDiskBenchmark, BLOCK_SIZES
+from benchmarks.disk_enhanced import (
+    EnhancedDiskBenchmark, BLOCK_SIZES, BlockSize, DISK_BLOCK_SIZES, resolve_block_size
+)
 
-__all__ = ['BenchmarkBase', 'ZFSPoolBenchmark', 'POOL_BLOCK_SIZES', 'EnhancedDiskBenchmark', 'BLOCK_SIZES']
+__all__ = ['BenchmarkBase', 'ZFSPoolBenchmark', 'POOL_BLOCK_SIZES', 'EnhancedDiskBenchmark', 'BLOCK_SIZES',
+           'BlockSize', 'DISK_BLOCK_SIZES', 'resolve_block_size']
@@ -2,48 +2,266 @@
 Enhanced disk benchmark - multiple test modes and block sizes.
 """
 
-import subprocess
-import threading
+import asyncio
+import glob
+import os
+import random
+import re
 import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import fmean
 from benchmarks.base import BenchmarkBase
+from utils.raw_io import NS_PER_SEC, direct_read, drop_caches, mib_per_sec, opens_direct
+from utils.latency import LatencyHistogram
 from utils import (
     print_info, print_success, print_error, print_header, print_section,
     print_subheader, print_bullet, color_text, print_warning
 )
 
-# Block size options
+GIB = 1 << 30
+
+# Per-disk values resolved once in EnhancedDiskBenchmark.__init__
+DiskPlan = namedtuple("DiskPlan", "name model serial size_gib read_size_gib read_bytes")
+
+# Short per-disk solo read used to estimate each controller group's ceiling
+WARMUP_GIB = 1
+
+# Parallel aggregate below this fraction of the solo sum is reported as saturation
+SATURATION_RATIO = 0.8
+
+# Last PCI address in a sysfs device path identifies the disk's controller
+PCI_ADDR_RE = re.compile(r"[0-9a-f]{4}:[0-9a-f]{2}:[0-9a-f]{2}\.[0-9a-f]")
+
+# SCSI host adapter (hostN) a disk's device path runs through
+SCSI_HOST_RE = re.compile(r"/(host\d+)/")
+
+@dataclass(frozen=True)
+class BlockSize:
+    """One selectable disk read block size."""
+    name: str
+    bytes: int
+    description: str
+
+
+# Block size options; menu key N selects DISK_BLOCK_SIZES[N - 1]
+DISK_BLOCK_SIZES = (
+    BlockSize("4K", 4096, "4K (small random I/O)"),
+    BlockSize("32K", 32768, "32K (medium I/O)"),
+    BlockSize("128K", 131072, "128K (large sequential)"),
+    BlockSize("1M", 1048576, "1M (very large sequential)"),
+)
+DEFAULT_BLOCK_SIZE = DISK_BLOCK_SIZES[-1]
+_BLOCK_SIZE_BY_NAME = {block.name: block for block in DISK_BLOCK_SIZES}
+
+# Menu-keyed view kept for the CLI and config validation
 BLOCK_SIZES = {
-    "1": {"size": "4K", "bytes": 4096, "description": "4K (small random I/O)"},
-    "2": {"size": "32K", "bytes": 32768, "description": "32K (medium I/O)"},
-    "3": {"size": "128K", "bytes": 131072, "description": "128K (large sequential)"},
-    "4": {"size": "1M", "bytes": 1048576, "description": "1M (very large sequential)"}
+    str(key): {"size": block.name, "bytes": block.bytes, "description": block.description}
+    for key, block in enumerate(DISK_BLOCK_SIZES, start=1)
 }
 
 
-def run_dd_read_command(disk_name, read_size_gib, block_size="1M"):
+def resolve_block_size(block_size):
+    """
+    Turn a BlockSize, menu key ("1"-"4") or size name ("4K", "1M") into a BlockSize.
+    
+    Unknown values fall back to DEFAULT_BLOCK_SIZE (1M).
+    """
+    if isinstance(block_size, BlockSize):
+        return block_size
+    key = str(block_size).upper()
+    if key.isdigit() and 1 <= int(key) <= len(DISK_BLOCK_SIZES):
+        return DISK_BLOCK_SIZES[int(key) - 1]
+    return _BLOCK_SIZE_BY_NAME.get(key, DEFAULT_BLOCK_SIZE)
+
+
+def _parse_cpulist(cpulist):
+    """Expand a sysfs cpulist such as "0-7,16-23" into a set of CPU ids."""
+    cpus = set()
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _load_numa_cpus():
+    """Map each NUMA node id to the CPUs it owns, from /sys/devices/system/node."""
+    numa_cpus = {}
+    for path in glob.glob("/sys/devices/system/node/node[0-9]*/cpulist"):
+        node = int(os.path.basename(os.path.dirname(path))[4:])
+        try:
+            with open(path) as f:
+                numa_cpus[node] = frozenset(_parse_cpulist(f.read()))
+        except (OSError, ValueError):
+            continue
+    return numa_cpus
+
+
+# Built once in the parent; _init_worker hands both to worker processes
+NUMA_CPUS = _load_numa_cpus()
+BASE_AFFINITY = frozenset(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else frozenset()
+
+
+def _init_worker(numa_cpus, base_affinity):
+    """
+    Process pool initializer: adopt the parent's NUMA map and starting CPU set.
+    
+    Only fork children inherit module globals; spawn and forkserver workers
+    import the module afresh and would read their own affinity instead.
+    """
+    global NUMA_CPUS, BASE_AFFINITY
+    NUMA_CPUS = numa_cpus
+    BASE_AFFINITY = base_affinity
+
+
+def _numa_node_for(disk_name):
+    """
+    Find the NUMA node a disk's controller is attached to.
+    
+    Walks up from /sys/block/<disk>/device until a numa_node attribute is
+    found (virtio and some HBAs only expose it on the PCI parent).
+    
+    Returns:
+        int: Node id, or -1 if unknown
+    """
+    path = os.path.realpath(f"/sys/block/{disk_name}/device")
+    while path.startswith("/sys/devices"):
+        node_file = os.path.join(path, "numa_node")
+        if os.path.exists(node_file):
+            return _read_sysfs_int(node_file, -1)
+        path = os.path.dirname(path)
+    return -1
+
+
+def _pin_to_disk_node(disk_name):
+    """Restrict the calling process to CPUs local to the disk, when that is known."""
+    if len(NUMA_CPUS) < 2 or not hasattr(os, "sched_setaffinity"):
+        return
+    # Stay inside the CPU set we started with (cgroups, taskset); a reused
+    # pool worker may still be pinned to another disk's node
+    allowed = NUMA_CPUS.get(_numa_node_for(disk_name), frozenset()) & BASE_AFFINITY
+    os.sched_setaffinity(0, allowed or BASE_AFFINITY)
+
+
+@dataclass
+class BenchResult:
+    """Outcome of one read worker, small enough to ship back from a child process."""
+    name: str
+    speed: float
+    bytes_read: int
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+def read_disk(disk_name, read_size_gib, block_size="1M", offset_gib=0):
     """
-    Run a disk read test with specified block size.
+    Read a disk with the specified block size and report what happened.
+    
+    Reads are issued in-process with O_DIRECT so repeat iterations measure
+    the device instead of the page cache.
     
     Args:
         disk_name: Name of the disk device
         read_size_gib: Size to read in GiB
-        block_size: Block size string (e.g., "4K", "1M")
+        block_size: BlockSize or size name (e.g., "4K", "1M")
+        offset_gib: Where on the device to start reading, in GiB
         
     Returns:
-        float: Read speed in MiB/s
+        BenchResult: Disk name, read speed in MiB/s, bytes read and the
+                     per-request latency histogram
+    """
+    block_bytes = resolve_block_size(block_size).bytes
+    total_bytes = int(read_size_gib * GIB)
+    offset_bytes = int(offset_gib * GIB) // block_bytes * block_bytes
+    
+    latency = LatencyHistogram()
+    bytes_read, elapsed_ns = direct_read(
+        f"/dev/{disk_name}", total_bytes, block_bytes, offset_bytes, histogram=latency
+    )
+    return BenchResult(disk_name, mib_per_sec(bytes_read, elapsed_ns), bytes_read, latency)
+
+
+def _pooled_read(disk_name, *args):
+    """Worker-process entry point: pin to the disk's NUMA node, then read."""
+    _pin_to_disk_node(disk_name)
+    return read_disk(disk_name, *args)
+
+
+async def _gather_reads(jobs, groups=None, caps=None):
+    """Run read jobs in worker processes, at most caps[group] at a time per group."""
+    loop = asyncio.get_running_loop()
+    limits = {group: asyncio.Semaphore(cap) for group, cap in (caps or {}).items()}
+    
+    async def _read(pool, index, job):
+        limit = limits.get(groups[index]) if groups else None
+        if limit is None:
+            return await loop.run_in_executor(pool, _pooled_read, *job)
+        async with limit:
+            return await loop.run_in_executor(pool, _pooled_read, *job)
+    
+    with ProcessPoolExecutor(max_workers=len(jobs), initializer=_init_worker,
+                             initargs=(NUMA_CPUS, BASE_AFFINITY)) as pool:
+        # Bring every worker process up before dispatching reads, so the
+        # reads start together rather than trailing one fork per disk
+        await asyncio.gather(*(loop.run_in_executor(pool, os.getpid) for _ in jobs))
+        return await asyncio.gather(*(
+            _read(pool, index, job) for index, job in enumerate(jobs)
+        ))
+
+
+def run_concurrent_reads(jobs, groups=None, caps=None):
     """
-    block_bytes = BLOCK_SIZES.get(block_size, BLOCK_SIZES["4"])["bytes"]
-    total_bytes = read_size_gib * 1024 * 1024 * 1024
-    count = int(total_bytes / block_bytes)
+    Run several disk read tests simultaneously.
     
-    command = f"dd if=/dev/{disk_name} of=/dev/null bs={block_size} count={count} status=none"
-    start_time = time.time()
-    subprocess.run(command, shell=True)
-    end_time = time.time()
+    Each job runs in a separate process so the read loops, which spend
+    part of every iteration in the interpreter, never contend for the GIL.
     
-    total_time_taken = end_time - start_time
-    read_speed = total_bytes / 1024 / 1024 / total_time_taken
-    return read_speed
+    Args:
+        jobs: List of read_disk argument tuples
+              (disk_name, read_size_gib, block_size, offset_gib)
+        groups: Optional list giving each job's group key
+        caps: Optional dict of group key -> max jobs of that group in flight
+        
+    Returns:
+        list: BenchResult per job, in the same order as jobs
+    """
+    if not jobs:
+        return []
+    return asyncio.run(_gather_reads(jobs, groups, caps))
+
+
+def _read_sysfs_int(path, default):
+    """Read an integer sysfs attribute, returning default if it is missing."""
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return default
+
+
+def disk_topology(disk_name):
+    """
+    Look up where a disk sits in the storage topology.
+    
+    Args:
+        disk_name: Name of the disk device (e.g. "sda")
+        
+    Returns:
+        tuple: (controller, rotational, host_queue); controller is the PCI
+               address of the host adapter (or "unknown"), host_queue is the
+               adapter's can_queue (commands it accepts across all of its
+               disks), or None when the disk is not behind a SCSI host (e.g. NVMe)
+    """
+    sys_dir = f"/sys/block/{disk_name}"
+    device_path = os.path.realpath(f"{sys_dir}/device")
+    pci_addrs = PCI_ADDR_RE.findall(device_path)
+    controller = pci_addrs[-1] if pci_addrs else "unknown"
+    rotational = _read_sysfs_int(f"{sys_dir}/queue/rotational", 1) == 1
+    hosts = SCSI_HOST_RE.findall(device_path)
+    host_queue = _read_sysfs_int(f"/sys/class/scsi_host/{hosts[-1]}/can_queue", None) if hosts else None
+    return controller, rotational, host_queue
 
 
 class EnhancedDiskBenchmark(BenchmarkBase):
@@ -60,7 +278,7 @@ class EnhancedDiskBenchmark(BenchmarkBase):
     description = "Enhanced individual disk benchmark with serial, parallel, and seek-stress modes"
     
     def __init__(self, disk_info, system_info, test_mode="serial", 
-                 block_size="1M", iterations=2, seek_threads=4):
+                 block_size="1M", iterations=2, seek_threads=4, warmup=0):
         """
         Initialize enhanced disk benchmark.
         
@@ -68,17 +286,44 @@ class EnhancedDiskBenchmark(BenchmarkBase):
             disk_info: List of disk information dictionaries
             system_info: System information dictionary
             test_mode: "serial", "parallel", or "seek_stress"
-            block_size: Block size key ("1"=4K, "2"=32K, "3"=128K, "4"=1M)
+            block_size: Block size key ("1"=4K, "2"=32K, "3"=128K, "4"=1M),
+                        size name, or BlockSize
             iterations: Number of iterations to run
             seek_threads: Number of threads per disk for seek_stress mode
+            warmup: Number of unrecorded runs before the measured iterations
         """
         self.disk_info = disk_info
         self.system_info = system_info
         self.test_mode = test_mode
-        self.block_size = BLOCK_SIZES.get(block_size, BLOCK_SIZES["4"])["size"]
-        self.block_desc = BLOCK_SIZES.get(block_size, BLOCK_SIZES["4"])["description"]
+        self.block = resolve_block_size(block_size)
+        self.block_size = self.block.name
+        self.block_desc = self.block.description
         self.iterations = iterations
         self.seek_threads = seek_threads
+        self.warmup = warmup
+        self._plans = self._build_plans()
+        # Set once this benchmark has dropped caches for its buffered disks
+        self._caches_dropped = False
+    
+    def _build_plans(self):
+        """Resolve per-disk sizes once (read size = min of system RAM and disk size)."""
+        system_ram_gib = self.system_info.get('physmem', 0) / GIB
+        plans = []
+        for disk in self.disk_info:
+            disk_name = disk.get("name", "N/A")
+            if disk_name == "N/A":
+                continue
+            size_gib = disk.get("size", 0) / GIB
+            read_size_gib = min(system_ram_gib, size_gib)
+            plans.append(DiskPlan(
+                name=disk_name,
+                model=disk.get("model", "N/A"),
+                serial=disk.get("serial", "N/A"),
+                size_gib=size_gib,
+                read_size_gib=read_size_gib,
+                read_bytes=int(read_size_gib * GIB),
+            ))
+        return plans
     
     def validate(self) -> bool:
         """Check if we have disk information to test."""
@@ -96,6 +341,7 @@ class EnhancedDiskBenchmark(BenchmarkBase):
         Returns:
             list: Results for each disk tested.
         """
+        self._drop_caches_if_buffered()
         if self.test_mode == "serial":
             return self._run_serial()
         elif self.test_mode == "parallel":
@@ -106,11 +352,64 @@ class EnhancedDiskBenchmark(BenchmarkBase):
             print_error(f"Unknown test mode: {self.test_mode}")
             return []
     
-    def _calculate_read_size(self, disk):
-        """Calculate read size for a disk (min of system RAM and disk size)."""
-        system_ram_gib = self.system_info.get('physmem', 0) / (1024 ** 3)
-        disk_size_gib = disk.get("size", 0) / (1024 ** 3)
-        return min(system_ram_gib, disk_size_gib)
+    def _classify_disks(self):
+        """
+        Group disks by (controller, rotational) and size each group's concurrency cap.
+        
+        Each reader keeps one request in flight, so a group is only capped
+        when its host adapter accepts fewer commands (can_queue) than it has
+        disks; the per-disk queue_depth says nothing about that.
+        
+        Returns:
+            tuple: ({(controller, rotational): [plans]}, {(controller, rotational): cap})
+        """
+        groups = {}
+        host_queues = {}
+        for plan in self._plans:
+            controller, rotational, host_queue = disk_topology(plan.name)
+            key = (controller, rotational)
+            groups.setdefault(key, []).append(plan)
+            if host_queue:
+                host_queues[key] = min(host_queues.get(key, host_queue), host_queue)
+        
+        # Without a reported adapter limit, let the whole group run at once
+        caps = {
+            key: min(host_queues.get(key, len(plans)), len(plans))
+            for key, plans in groups.items()
+        }
+        return groups, caps
+    
+    def _measure_solo_speeds(self):
+        """Read WARMUP_GIB from each disk on its own to get an unloaded baseline."""
+        solo = {}
+        for plan in self._plans:
+            solo[plan.name] = read_disk(
+                plan.name, min(WARMUP_GIB, plan.read_size_gib), self.block
+            ).speed
+        return solo
+    
+    def _run_label(self, run_num):
+        """Describe run_num (which counts warmup runs first) for progress output."""
+        if run_num < self.warmup:
+            return f"Warmup run {run_num + 1} of {self.warmup} (not recorded)"
+        return f"Run {run_num - self.warmup + 1} of {self.iterations}"
+    
+    def _drop_caches_if_buffered(self):
+        """
+        Drop caches once per benchmark if any disk refuses O_DIRECT and will be read buffered.
+        
+        O_DIRECT reads never touch the page cache, and buffered ones drop
+        their pages (POSIX_FADV_DONTNEED) when done, so a single drop before
+        the first read is enough; dropping every iteration would also evict
+        the whole ARC each time. Each benchmark (every run of a batch) gets
+        its own drop.
+        """
+        if self._caches_dropped:
+            return
+        if not all(opens_direct(f"/dev/{plan.name}") for plan in self._plans):
+            self._caches_dropped = True
+            if not drop_caches():
+                print_warning("Could not drop caches; the first buffered disk read may be served from RAM")
     
     def _run_serial(self):
         """Run serial benchmark - one disk at a time."""
@@ -120,39 +419,42 @@ class EnhancedDiskBenchmark(BenchmarkBase):
         
         results = []
         
-        for disk in self.disk_info:
-            disk_name = disk.get("name", "N/A")
-            if disk_name == "N/A":
-                continue
-                
-            read_size_gib = self._calculate_read_size(disk)
+        for plan in self._plans:
             speeds = []
+            latency = LatencyHistogram()
             
-            print_section(f"Testing Disk: {disk_name}")
-            print_info(f"Read size: {read_size_gib:.2f} GiB")
-            print_info(f"Model: {disk.get('model', 'N/A')}")
+            print_section(f"Testing Disk: {plan.name}")
+            print_info(f"Read size: {plan.read_size_gib:.2f} GiB")
+            print_info(f"Model: {plan.model}")
             
-            for run_num in range(self.iterations):
-                print_info(f"Run {run_num + 1} of {self.iterations}...")
-                speed = run_dd_read_command(disk_name, read_size_gib, self.block_size)
-                speeds.append(speed)
-                print_info(f"Run {run_num+1}: {color_text(f'{speed:.2f} MiB/s', 'YELLOW')}")
+            for run_num in range(self.warmup + self.iterations):
+                label = self._run_label(run_num)
+                print_info(f"{label}...")
+                outcome = read_disk(plan.name, plan.read_size_gib, self.block)
+                speed = outcome.speed
+                if run_num >= self.warmup:
+                    speeds.append(speed)
+                    latency.merge(outcome.latency)
+                print_info(f"{label}: {color_text(f'{speed:.2f} MiB/s', 'YELLOW')}")
             
-            average_speed = sum(speeds) / len(speeds) if speeds else 0
+            average_speed = fmean(speeds) if speeds else 0.0
             print_success(f"Average: {color_text(f'{average_speed:.2f} MiB/s', 'GREEN')}")
             
             results.append({
-                "disk": disk_name,
-                "model": disk.get("model", "N/A"),
-                "serial": disk.get("serial", "N/A"),
-                "size_gib": disk.get("size", 0) / (1024 ** 3),
+                "disk": plan.name,
+                "model": plan.model,
+                "serial": plan.serial,
+                "size_gib": plan.size_gib,
                 "block_size": self.block_size,
-                "read_size_gib": read_size_gib,
+                "read_size_gib": plan.read_size_gib,
                 "speeds": speeds,
                 "average_speed": average_speed,
+                "latency_us": latency.summary_us(),
                 "iterations": self.iterations,
                 "test_mode": "serial"
             })
+            if self.warmup:
+                results[-1]["warmup_iterations"] = self.warmup
         
         self._print_summary(results)
         return results
@@ -164,82 +466,89 @@ class EnhancedDiskBenchmark(BenchmarkBase):
         print_info(f"Block size: {self.block_desc}")
         print_warning("This will heavily load your storage system!")
         
-        results = []
+        # Stage disks per controller/media class so one saturated HBA is visible
+        groups, caps = self._classify_disks()
+        group_of = {plan.name: key for key, plans in groups.items() for plan in plans}
+        for (controller, rotational), plans in groups.items():
+            media = "HDD" if rotational else "SSD"
+            print_info(f"Controller {controller} ({media}): {len(plans)} disks, "
+                       f"up to {caps[(controller, rotational)]} at once")
         
-        # Calculate read sizes for all disks
-        disk_configs = []
-        for disk in self.disk_info:
-            disk_name = disk.get("name", "N/A")
-            if disk_name != "N/A":
-                read_size_gib = self._calculate_read_size(disk)
-                disk_configs.append({
-                    "name": disk_name,
-                    "disk_info": disk,
-                    "read_size_gib": read_size_gib
-                })
-        
-        for run_num in range(self.iterations):
-            print_section(f"Parallel Test Run {run_num + 1} of {self.iterations}")
-            print_info(f"Testing {len(disk_configs)} disks simultaneously...")
+        print_info(f"Measuring solo baseline ({WARMUP_GIB} GiB per disk)...")
+        solo = self._measure_solo_speeds()
+        
+        # The job list is identical for every run
+        jobs = [(plan.name, plan.read_size_gib, self.block, 0) for plan in self._plans]
+        job_groups = [group_of[plan.name] for plan in self._plans]
+        
+        # One result entry per disk, filled in as the runs complete
+        results_by_disk = {
+            plan.name: {
+                "disk": plan.name,
+                "model": plan.model,
+                "serial": plan.serial,
+                "size_gib": plan.size_gib,
+                "block_size": self.block_size,
+                "read_size_gib": plan.read_size_gib,
+                "speeds": [],
+                "controller": group_of[plan.name][0],
+                "rotational": group_of[plan.name][1],
+                # Disks of this group read at once (group size when uncapped)
+                "concurrency_cap": caps[group_of[plan.name]],
+                "test_mode": "parallel"
+            }
+            for plan in self._plans
+        }
+        
+        latency_by_disk = {plan.name: LatencyHistogram() for plan in self._plans}
+        
+        for run_num in range(self.warmup + self.iterations):
+            print_section(f"Parallel Test {self._run_label(run_num)}")
+            print_info(f"Testing {len(self._plans)} disks simultaneously...")
             
             # Start all tests simultaneously
-            threads = []
-            run_results = {}
-            
-            def test_disk(disk_config, results_dict):
-                speed = run_dd_read_command(
-                    disk_config["name"], 
-                    disk_config["read_size_gib"], 
-                    self.block_size
-                )
-                results_dict[disk_config["name"]] = speed
-            
-            start_time = time.time()
-            for disk_config in disk_configs:
-                thread = threading.Thread(
-                    target=test_disk, 
-                    args=(disk_config, run_results)
-                )
-                thread.start()
-                threads.append(thread)
-            
-            # Wait for all to complete
-            for thread in threads:
-                thread.join()
-            end_time = time.time()
+            start_ns = time.perf_counter_ns()
+            outcomes = run_concurrent_reads(jobs, job_groups, caps)
+            speeds = [outcome.speed for outcome in outcomes]
+            parallel_duration = (time.perf_counter_ns() - start_ns) / NS_PER_SEC
             
-            parallel_duration = end_time - start_time
             print_info(f"Parallel run completed in {parallel_duration:.1f} seconds")
+            self._report_saturation(groups, solo, dict(zip((p.name for p in self._plans), speeds)))
+            
+            if run_num < self.warmup:
+                continue
             
             # Store results
-            for disk_config in disk_configs:
-                disk_name = disk_config["name"]
-                speed = run_results.get(disk_name, 0)
-                
-                # Find or create result entry
-                existing = next((r for r in results if r["disk"] == disk_name), None)
-                if existing:
-                    existing["speeds"].append(speed)
-                else:
-                    results.append({
-                        "disk": disk_name,
-                        "model": disk_config["disk_info"].get("model", "N/A"),
-                        "serial": disk_config["disk_info"].get("serial", "N/A"),
-                        "size_gib": disk_config["disk_info"].get("size", 0) / (1024 ** 3),
-                        "block_size": self.block_size,
-                        "read_size_gib": disk_config["read_size_gib"],
-                        "speeds": [speed],
-                        "test_mode": "parallel"
-                    })
+            for plan, outcome in zip(self._plans, outcomes):
+                results_by_disk[plan.name]["speeds"].append(outcome.speed)
+                latency_by_disk[plan.name].merge(outcome.latency)
+        
+        results = list(results_by_disk.values())
         
         # Calculate averages
         for result in results:
-            result["average_speed"] = sum(result["speeds"]) / len(result["speeds"])
+            result["average_speed"] = fmean(result["speeds"])
             result["iterations"] = self.iterations
+            if self.warmup:
+                result["warmup_iterations"] = self.warmup
+            result["latency_us"] = latency_by_disk[result["disk"]].summary_us()
         
         self._print_summary(results)
         return results
     
+    def _report_saturation(self, groups, solo, speeds):
+        """Warn about controller groups whose parallel total falls well short of the solo sum."""
+        for (controller, rotational), plans in groups.items():
+            if len(plans) < 2:
+                continue
+            ceiling = sum(solo[plan.name] for plan in plans)
+            aggregate = sum(speeds[plan.name] for plan in plans)
+            if ceiling > 0 and aggregate < ceiling * SATURATION_RATIO:
+                print_warning(
+                    f"Controller {controller} looks saturated: {aggregate:.0f} MiB/s together "
+                    f"vs {ceiling:.0f} MiB/s solo ({aggregate / ceiling:.0%})"
+                )
+    
     def _run_seek_stress(self):
         """Run seek-stress benchmark - multiple threads per disk."""
         print_header("Seek-Stress Disk Benchmark")
@@ -247,95 +556,89 @@ class EnhancedDiskBenchmark(BenchmarkBase):
         print_info(f"Block size: {self.block_desc}")
         print_warning("This will heavily stress individual disk seek mechanisms!")
         
-        results = []
-        
         # Fixed read size for seek test (50 GiB per thread)
         base_read_size_gib = 50
         
-        for run_num in range(self.iterations):
-            print_section(f"Seek-Stress Run {run_num + 1} of {self.iterations}")
-            
-            all_threads = []
-            run_results = {}
-            
-            def test_disk_thread(disk_name, read_size, thread_id, results_dict):
-                speed = run_dd_read_command(disk_name, read_size, self.block_size)
-                key = f"{disk_name}_thread_{thread_id}"
-                results_dict[key] = {
-                    "speed": speed,
-                    "disk_name": disk_name,
-                    "thread_id": thread_id
-                }
-                print_info(f"  {disk_name} thread {thread_id}: {speed:.0f} MiB/s")
-            
-            # Start threads for all disks
-            start_time = time.time()
-            for disk in self.disk_info:
-                disk_name = disk.get("name", "N/A")
-                if disk_name == "N/A":
-                    continue
-                
-                disk_size_gib = disk.get("size", 0) / (1024 ** 3)
-                read_size_gib = min(base_read_size_gib, disk_size_gib)
-                
-                for thread_id in range(self.seek_threads):
-                    thread = threading.Thread(
-                        target=test_disk_thread,
-                        args=(disk_name, read_size_gib, thread_id, run_results)
-                    )
-                    thread.start()
-                    all_threads.append(thread)
+        job_threads = [
+            (plan.name, thread_id)
+            for plan in self._plans for thread_id in range(self.seek_threads)
+        ]
+        
+        results_by_disk = {
+            plan.name: {
+                "disk": plan.name,
+                "model": plan.model,
+                "serial": plan.serial,
+                "size_gib": plan.size_gib,
+                "block_size": self.block_size,
+                "read_size_gib": base_read_size_gib,
+                "thread_count": self.seek_threads,
+                "speeds": [],
+                "test_mode": "seek_stress"
+            }
+            for plan in self._plans
+        }
+        
+        latency_by_disk = {plan.name: LatencyHistogram() for plan in self._plans}
+        
+        for run_num in range(self.warmup + self.iterations):
+            print_section(f"Seek-Stress {self._run_label(run_num)}")
+            jobs = self._seek_jobs(base_read_size_gib, random.Random(run_num))
             
-            # Wait for all threads
-            print_info(f"Waiting for {len(all_threads)} threads to complete...")
-            for thread in all_threads:
-                thread.join()
-            end_time = time.time()
+            print_info(f"Waiting for {len(jobs)} threads to complete...")
+            start_ns = time.perf_counter_ns()
+            outcomes = run_concurrent_reads(jobs)
+            duration = (time.perf_counter_ns() - start_ns) / NS_PER_SEC
             
-            duration = end_time - start_time
             print_info(f"Seek-stress run completed in {duration:.1f} seconds")
             
             # Aggregate results by disk
             disk_threads = {}
-            for key, data in run_results.items():
-                disk_name = data["disk_name"]
-                if disk_name not in disk_threads:
-                    disk_threads[disk_name] = []
-                disk_threads[disk_name].append(data["speed"])
+            for (disk_name, thread_id), outcome in zip(job_threads, outcomes):
+                print_info(f"  {disk_name} thread {thread_id}: {outcome.speed:.0f} MiB/s")
+                disk_threads.setdefault(disk_name, []).append(outcome.speed)
+            
+            if run_num < self.warmup:
+                continue
+            
+            for (disk_name, _), outcome in zip(job_threads, outcomes):
+                latency_by_disk[disk_name].merge(outcome.latency)
             
             # Store aggregated results
-            for disk in self.disk_info:
-                disk_name = disk.get("name", "N/A")
-                if disk_name not in disk_threads:
-                    continue
-                
-                thread_speeds = disk_threads[disk_name]
-                avg_speed = sum(thread_speeds) / len(thread_speeds)
-                
-                existing = next((r for r in results if r["disk"] == disk_name), None)
-                if existing:
-                    existing["speeds"].append(avg_speed)
-                else:
-                    results.append({
-                        "disk": disk_name,
-                        "model": disk.get("model", "N/A"),
-                        "serial": disk.get("serial", "N/A"),
-                        "size_gib": disk.get("size", 0) / (1024 ** 3),
-                        "block_size": self.block_size,
-                        "read_size_gib": base_read_size_gib,
-                        "thread_count": self.seek_threads,
-                        "speeds": [avg_speed],
-                        "test_mode": "seek_stress"
-                    })
+            for disk_name, thread_speeds in disk_threads.items():
+                results_by_disk[disk_name]["speeds"].append(fmean(thread_speeds))
+        
+        results = list(results_by_disk.values())
         
         # Calculate averages
         for result in results:
-            result["average_speed"] = sum(result["speeds"]) / len(result["speeds"])
+            result["average_speed"] = fmean(result["speeds"])
             result["iterations"] = self.iterations
+            if self.warmup:
+                result["warmup_iterations"] = self.warmup
+            result["latency_us"] = latency_by_disk[result["disk"]].summary_us()
         
         self._print_summary(results)
         return results
     
+    def _seek_jobs(self, base_read_size_gib, rng):
+        """
+        Build one read job per disk thread, in job_threads order.
+        
+        Every thread starts at its own random block-aligned offset and reads
+        sequentially from there, so the kernel cannot merge the threads into
+        one stream and the heads have to seek between them.
+        """
+        jobs = []
+        for plan in self._plans:
+            read_size_gib = min(base_read_size_gib, plan.size_gib)
+            slack_bytes = int(plan.size_gib * GIB) - int(read_size_gib * GIB)
+            
+            for _ in range(self.seek_threads):
+                start = rng.randrange(0, slack_bytes + 1, self.block.bytes) if slack_bytes > 0 else 0
+                jobs.append((plan.name, read_size_gib, self.block, start / GIB))
+        return jobs
+    
     def _print_summary(self, results):
         """Print summary of benchmark results."""
         if not results:
@@ -366,6 +669,11 @@ class EnhancedDiskBenchmark(BenchmarkBase):
                 
                 print_bullet(f"  Average: {color_text(f'{avg_speed:.2f} MiB/s', 'GREEN')}")
                 
+                latency = result.get("latency_us")
+                if latency:
+                    print_bullet(f"  Latency p50/p90/p99: {latency['p50']:.0f} / "
+                                 f"{latency['p90']:.0f} / {latency['p99']:.0f} µs")
+                
                 if result.get("thread_count"):
                     print_bullet(f"  Threads: {result['thread_count']}")
                 print()
@@ -373,8 +681,8 @@ class EnhancedDiskBenchmark(BenchmarkBase):
         # Print simple statistics
         if len(results) > 1:
             all_speeds = [r["average_speed"] for r in results]
-            overall_avg = sum(all_speeds) / len(all_speeds)
+            lo, hi, overall_avg = min(all_speeds), max(all_speeds), fmean(all_speeds)
             print_subheader("Overall Statistics")
             print_info(f"Disks tested: {len(results)}")
             print_info(f"Average speed: {overall_avg:.2f} MiB/s")
-            print_info(f"Speed range: {min(all_speeds):.2f} - {max(all_speeds):.2f} MiB/s")
+            print_info(f"Speed range: {lo:.2f} - {hi:.2f} MiB/s")
@@ -5,27 +5,118 @@ Integrates with zpool iostat collector for telemetry during benchmark runs.
 """
 
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from statistics import fmean, stdev
 import threading
 import time
 import os
 from benchmarks.base import BenchmarkBase
+from utils.raw_io import (
+    SEED_BYTES, create_seed_fd, drop_caches, preallocate_file, write_file, read_file, mib_per_sec
+)
+from utils.fio import allowed_cpus, fio_available, run_fio
 from utils import (
     print_info, print_success, print_section, print_header,
-    print_subheader, print_bullet, color_text
+    print_subheader, print_bullet, color_text, print_warning, print_error
 )
 
 
-def run_dd_command(command):
-    """Execute a dd command in a subprocess."""
-    subprocess.run(command, shell=True)
+# zpool iostat prints human-readable bandwidth in powers of 1024
+_IOSTAT_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def _iostat_bytes(value):
+    """Bytes per second for a zpool iostat bandwidth column such as "292M"."""
+    if not value or value == "-":
+        return 0.0
+    if value[-1] in _IOSTAT_UNITS:
+        return float(value[:-1]) * _IOSTAT_UNITS[value[-1]]
+    return float(value)
+
+
+class IostatWindow:
+    """
+    Context manager that picks out the pool bandwidth the telemetry collector saw while a phase ran.
+    
+    Gives the throughput the pool itself reported, independent of Python
+    and thread scheduling overhead. Reads the samples the running
+    ZpoolIostatCollector appends rather than starting a second zpool iostat,
+    so the pool is only ever polled once. If the phase is shorter than one
+    collector interval, no samples are collected.
+    
+    Usage:
+        with IostatWindow(collector) as window:
+            # ... run workload ...
+        write_bw = window.mean_bw_bytes("write")
+    """
+    
+    def __init__(self, collector):
+        self._collected = collector.telemetry.samples
+        self._first = 0
+        self.samples = []  # (read_bytes_per_sec, write_bytes_per_sec)
+    
+    def __enter__(self):
+        self._first = len(self._collected)
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for sample in self._collected[self._first:]:
+            try:
+                self.samples.append(
+                    (_iostat_bytes(sample.bandwidth_read), _iostat_bytes(sample.bandwidth_write))
+                )
+            except ValueError:
+                continue
+        return False
+    
+    def mean_bw_bytes(self, direction):
+        """
+        Mean pool bandwidth over the sampled interval.
+        
+        Args:
+            direction: "read" or "write"
+            
+        Returns:
+            float or None: Bytes per second, or None if nothing was sampled
+        """
+        if not self.samples:
+            return None
+        column = 0 if direction == "read" else 1
+        return fmean(sample[column] for sample in self.samples)
+
+
+# Concurrent unlinks let ZFS tear down several dnodes at once
+MAX_UNLINK_WORKERS = 32
+
+
+def _unlink(path):
+    """Remove path, ignoring files that are already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _unlink_all(paths):
+    """Remove every path, several at a time."""
+    paths = list(paths)
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_UNLINK_WORKERS, len(paths))) as pool:
+        # list() so any unexpected error is raised here rather than dropped
+        list(pool.map(_unlink, paths))
+
+
+def test_file_paths(dataset_path, file_prefix, num_threads):
+    """Paths of the per-thread test files, in thread order."""
+    return [f"{dataset_path}/{file_prefix}{i}.dat" for i in range(num_threads)]
 
 
 def cleanup_test_files(dataset_path, file_prefix, num_threads):
     """Clean up test files for a specific thread count."""
-    for i in range(num_threads):
-        file_path = f"{dataset_path}/{file_prefix}{i}.dat"
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    _unlink_all(test_file_paths(dataset_path, file_prefix, num_threads))
 
 
 def parse_block_size_to_bytes(block_size_str):
@@ -62,81 +153,418 @@ POOL_BLOCK_SIZES = {
     "11": {"size": "16M",  "description": "16M  - Maximum block size"},
 }
 
+# Stop scaling up once write speed moves less than this between thread counts
+PLATEAU_RATIO = 0.05
+
 # Data written per thread (constant regardless of block size)
 BYTES_PER_THREAD = 20 * 1024 * 1024 * 1024  # 20 GiB
 
+# Seconds to wait for every phase worker to reach the start barrier
+START_TIMEOUT = 60
+
+
+def _after_barrier(start, cpu, func, *args):
+    """
+    Worker body: pin to cpu (if given), wait for the start barrier, then run func(*args).
+    
+    The original affinity is restored afterwards, since pool threads are
+    reused by later phases that may not be pinned (or pinned elsewhere).
+    """
+    original = None
+    try:
+        try:
+            if cpu is not None:
+                # pid 0 is the calling thread
+                original = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {cpu})
+            start.wait()
+        except BaseException:
+            # Break the barrier so the main thread and the other workers stop waiting
+            start.abort()
+            raise
+        return func(*args)
+    finally:
+        if original is not None:
+            os.sched_setaffinity(0, original)
+
+
+def _run_phase(func, jobs, executor=None, pin_threads=False, cpu_offset=0):
+    """
+    Run func(*job) for every job on its own worker thread, all at once.
+    
+    Every worker is parked on a barrier before the clock starts, so thread
+    start-up cost and skew stay out of the measurement and all workers are
+    released together.
+    
+    Args:
+        func: Worker function returning the bytes it moved
+        jobs: Argument tuples, one per worker
+        executor: ThreadPoolExecutor to reuse, with at least len(jobs) idle
+                  workers (queued jobs could never reach the barrier).
+                  A temporary one is used if omitted.
+        pin_threads: Pin worker i to the i-th allowed CPU (wrapping) before
+                     the barrier, so the scheduler cannot migrate it mid-phase
+        cpu_offset: Start pinning this many CPUs in, so a phase running
+                    alongside another does not share its CPUs
+    
+    Returns:
+        tuple: (total bytes moved, elapsed nanoseconds)
+    
+    Raises:
+        ValueError: If executor has fewer workers than there are jobs
+    """
+    if executor is not None and executor._max_workers < len(jobs):
+        raise ValueError(
+            f"Executor has {executor._max_workers} workers but the phase needs {len(jobs)}"
+        )
+    start = threading.Barrier(len(jobs) + 1)
+    cpus = (allowed_cpus() if pin_threads else None) or [None]
+    if executor is None:
+        pool_cm = ThreadPoolExecutor(max_workers=max(1, len(jobs)))
+    else:
+        # Borrowed pool: don't shut it down on the way out
+        pool_cm = nullcontext(executor)
+    with pool_cm as pool:
+        futures = [
+            pool.submit(_after_barrier, start, cpus[(cpu_offset + i) % len(cpus)], func, *job)
+            for i, job in enumerate(jobs)
+        ]
+        # Write out buffered console output now (stdout is block-buffered when
+        # piped to a log) so it cannot be written out inside the timed window
+        sys.stdout.flush()
+        try:
+            start.wait(timeout=START_TIMEOUT)
+        except threading.BrokenBarrierError:
+            # A worker failed before the barrier, or never got a thread;
+            # release the rest, then report the worker's own error
+            start.abort()
+            wait(futures)
+            for future in futures:
+                error = future.exception()
+                if error is not None and not isinstance(error, threading.BrokenBarrierError):
+                    raise error
+            raise RuntimeError(
+                f"Phase workers did not all reach the start barrier within {START_TIMEOUT}s"
+            )
+        start_ns = time.perf_counter_ns()
+        # result() also re-raises anything a worker hit
+        moved = sum(future.result() for future in futures)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+    return moved, elapsed_ns
+
+
+def _check_transfer(iteration_num, phase, moved, expected):
+    """Warn if a phase moved fewer (or more) bytes than it was asked to."""
+    if moved != expected:
+        print_warning(
+            f"Iteration {iteration_num} {phase}: moved {moved:,} of {expected:,} bytes; "
+            "speed is computed from the bytes actually moved"
+        )
+
+
+# Snapshot streamed by the zfs send read phase; destroyed straight afterwards
+SEND_SNAPSHOT = "tn-bench-read"
+
+
+def zfs_send_read(dataset_name):
+    """
+    Read the whole test dataset back with `zfs send` into /dev/null.
+    
+    The stream is produced inside ZFS from a snapshot, so no per-file
+    open/read path is involved. It is a single sequential stream whatever
+    the thread count. The snapshot is taken and sized before the clock
+    starts and destroyed afterwards.
+    
+    Args:
+        dataset_name: Dataset to snapshot (e.g. "tank/tn-bench")
+    
+    Returns:
+        tuple: (stream bytes, elapsed nanoseconds)
+    
+    Raises:
+        RuntimeError: If a zfs command fails
+    """
+    snapshot = f"{dataset_name}@{SEND_SNAPSHOT}"
+    result = subprocess.run(["zfs", "snapshot", snapshot], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"zfs snapshot {snapshot} failed: {result.stderr.strip()}")
+    try:
+        # Dry run with parsable output: "size\t<bytes>" is the stream length
+        result = subprocess.run(["zfs", "send", "-nP", snapshot], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"zfs send -nP {snapshot} failed: {result.stderr.strip()}")
+        stream_bytes = 0
+        for line in (result.stdout + result.stderr).splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[0] == "size":
+                stream_bytes = int(parts[1])
+        with open(os.devnull, "wb") as null:
+            sys.stdout.flush()
+            start_ns = time.perf_counter_ns()
+            result = subprocess.run(["zfs", "send", snapshot], stdout=null, stderr=subprocess.PIPE, text=True)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+        if result.returncode != 0:
+            raise RuntimeError(f"zfs send {snapshot} failed: {result.stderr.strip()}")
+    finally:
+        subprocess.run(["zfs", "destroy", snapshot], capture_output=True)
+    return stream_bytes, elapsed_ns
+
+
+def _pool_speed(sampler, direction):
+    """Pool-reported MiB/s for a finished IostatWindow phase, or None."""
+    bw = sampler.mean_bw_bytes(direction) if sampler else None
+    return bw / (1024 * 1024) if bw is not None else None
+
+
+def _file_size(path):
+    """Size of path in bytes, or None if it does not exist."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def _preallocate_all(paths, size_bytes, reuse_files=False, executor=None):
+    """
+    Preallocate every path concurrently, outside any timed window.
+    
+    With reuse_files set, files that already have size_bytes are left alone.
+    """
+    pending = [
+        path for path in paths
+        if not (reuse_files and _file_size(path) == size_bytes)
+    ]
+    if not pending:
+        return
+    if executor is None:
+        pool_cm = ThreadPoolExecutor(max_workers=len(pending))
+    else:
+        pool_cm = nullcontext(executor)
+    with pool_cm as pool:
+        # list() so any error is raised here rather than dropped
+        list(pool.map(preallocate_file, pending, [size_bytes] * len(pending)))
+
+
+def _write_phase(paths, bytes_per_thread, block_size_bytes, iteration_num, seed_fd,
+                 collector=None, sync_depth=0, engine="python", direct_write=False,
+                 executor=None, zero_data=False, reuse_files=False, pin_threads=False):
+    """
+    Write bytes_per_thread to every path at once and time it.
+    
+    With reuse_files set, files left at full size by an earlier iteration
+    are overwritten in place rather than truncated and preallocated again.
+    
+    Returns:
+        tuple: (write_speed, bytes_written, pool_write_speed)
+    """
+    threads = len(paths)
+    print_info(f"Iteration {iteration_num}: Writing...")
+    if engine == "python":
+        # Stagger writers through the seed so no two files start with the same records
+        seed_blocks = os.fstat(seed_fd).st_size // block_size_bytes
+        stride = max(1, seed_blocks // threads) * block_size_bytes
+        # Size the files before the clock starts (fio lays its files out itself)
+        _preallocate_all(paths, bytes_per_thread, reuse_files, executor)
+    with (IostatWindow(collector) if collector else nullcontext()) as sampler:
+        if engine == "fio":
+            bytes_written, elapsed_ns = run_fio(
+                "write", paths, bytes_per_thread, block_size_bytes, sync_depth,
+                direct=direct_write, zero_buffers=zero_data, pin_cpus=pin_threads
+            )
+        else:
+            bytes_written, elapsed_ns = _run_phase(
+                write_file,
+                [(path, seed_fd, bytes_per_thread, block_size_bytes, sync_depth * block_size_bytes,
+                  i * stride, False, direct_write) for i, path in enumerate(paths)],
+                executor, pin_threads
+            )
+    pool_write_speed = _pool_speed(sampler, "write")
+    _check_transfer(iteration_num, "write", bytes_written, threads * bytes_per_thread)
+    write_speed = mib_per_sec(bytes_written, elapsed_ns)
+    
+    print_info(f"Iteration {iteration_num} write: {color_text(f'{write_speed:.2f} MB/s', 'YELLOW')}")
+    return write_speed, bytes_written, pool_write_speed
+
+
+def _read_phase(paths, bytes_per_thread, block_size_bytes, iteration_num, dataset_name=None,
+                engine="python", direct_read=False, executor=None, zfs_send=False,
+                pin_threads=False, cpu_offset=0, collector=None):
+    """
+    Read every path back at once and time it.
+    
+    cpu_offset shifts pinned workers past the CPUs of a write phase running
+    at the same time (see _run_phase).
+    
+    Returns:
+        tuple: (read_speed, pool_read_speed)
+    """
+    print_info(f"Iteration {iteration_num}: Reading...")
+    with (IostatWindow(collector) if collector else nullcontext()) as sampler:
+        if zfs_send:
+            bytes_read, elapsed_ns = zfs_send_read(dataset_name)
+        elif engine == "fio":
+            bytes_read, elapsed_ns = run_fio(
+                "read", paths, bytes_per_thread, block_size_bytes, direct=direct_read,
+                pin_cpus=pin_threads, cpu_offset=cpu_offset
+            )
+        else:
+            bytes_read, elapsed_ns = _run_phase(
+                read_file, [(path, block_size_bytes, direct_read) for path in paths], executor,
+                pin_threads, cpu_offset
+            )
+    pool_read_speed = _pool_speed(sampler, "read")
+    if not zfs_send:
+        # A send stream carries headers and metadata, so it never matches exactly
+        _check_transfer(iteration_num, "read", bytes_read, len(paths) * bytes_per_thread)
+    read_speed = mib_per_sec(bytes_read, elapsed_ns)
+    
+    print_info(f"Iteration {iteration_num} read: {color_text(f'{read_speed:.2f} MB/s', 'YELLOW')}")
+    return read_speed, pool_read_speed
+
 
 def run_single_iteration(threads, blocks_per_thread, block_size, block_size_bytes, file_prefix,
-                         dataset_path, iteration_num, on_segment_change=None):
+                         dataset_path, iteration_num, seed_fd, on_segment_change=None,
+                         dataset_name=None, sync_depth=0, engine="python", direct_read=False,
+                         direct_write=False, executor=None, drop_caches_before_read=False,
+                         zero_data=False, zfs_send=False, reuse_files=False, pin_threads=False,
+                         collector=None):
     """
     Run a single write/read iteration and cleanup.
     
     Args:
         threads: Number of concurrent threads
-        blocks_per_thread: Number of blocks each thread writes (count for dd)
-        block_size: Block size string for dd (e.g., '1M', '128k')
-        block_size_bytes: Block size in bytes (for speed calculation)
+        blocks_per_thread: Number of blocks each thread writes
+        block_size: Block size string (e.g., '1M', '128k')
+        block_size_bytes: Block size in bytes (I/O chunk and speed calculation)
         file_prefix: Prefix for test files
         dataset_path: Path to the test dataset
-        iteration_num: Current iteration number
+        iteration_num: Current iteration number or label (e.g. "W1" for a warmup)
+        seed_fd: Seed descriptor holding random data (see create_seed_fd);
+                 unused by the fio engine
         on_segment_change: Optional callback(label: str) invoked before each
                           write/read phase starts so the telemetry collector can
                           label the workload segment.
+        dataset_name: Full name of the dataset at dataset_path (used by zfs_send)
+        sync_depth: Blocks each writer writes between fdatasync() calls
+                    (0 = no syncs, data is left for the next txg)
+        engine: "python" for in-process sendfile() workers, "fio" to hand
+                each phase to a single fio process
+        direct_read: Read back with O_DIRECT so the read phase measures the
+                     vdevs rather than the ARC
+        direct_write: Write with O_DIRECT from a reused aligned buffer
+        executor: Optional ThreadPoolExecutor (at least `threads` workers)
+                  shared across iterations instead of fresh threads per phase
+        drop_caches_before_read: Flush and drop the page cache / ARC between
+                                 the write and read phases (untimed)
+        zero_data: Have fio write zeros (the in-process engine writes
+                   whatever seed_fd holds)
+        zfs_send: Time `zfs send` of a snapshot of the dataset instead of
+                  reading the files back (needs dataset_name)
+        reuse_files: Overwrite files left by the previous iteration in place
+                     and leave them for the next one; the caller removes them
+        pin_threads: Pin each worker (or fio job) to its own CPU
+        collector: Optional running ZpoolIostatCollector whose samples give
+                   the pool-reported speed of each phase
     
     Returns:
-        tuple: (write_speed, read_speed, bytes_written)
+        tuple: (write_speed, read_speed, bytes_written, pool_write_speed, pool_read_speed);
+               the pool_* speeds are what zpool iostat reported, or None
     """
-    # Write phase
+    paths = test_file_paths(dataset_path, file_prefix, threads)
+    bytes_per_thread = blocks_per_thread * block_size_bytes
+    
     if on_segment_change:
         on_segment_change(f"{threads}T-write")
-    print_info(f"Iteration {iteration_num}: Writing...")
-    start_time = time.time()
-    
-    threads_list = []
-    for i in range(threads):
-        command = f"dd if=/dev/urandom of={dataset_path}/{file_prefix}{i}.dat bs={block_size} count={blocks_per_thread} status=none"
-        thread = threading.Thread(target=run_dd_command, args=(command,))
-        thread.start()
-        threads_list.append(thread)
-    
-    for thread in threads_list:
-        thread.join()
-    
-    end_time = time.time()
-    total_time_taken = end_time - start_time
+    write_speed, bytes_written, pool_write_speed = _write_phase(
+        paths, bytes_per_thread, block_size_bytes, iteration_num, seed_fd, collector,
+        sync_depth, engine, direct_write, executor, zero_data, reuse_files,
+        pin_threads=pin_threads
+    )
     
-    bytes_written = threads * blocks_per_thread * block_size_bytes
-    write_speed = bytes_written / total_time_taken / (1024 * 1024)
-    
-    print_info(f"Iteration {iteration_num} write: {color_text(f'{write_speed:.2f} MB/s', 'YELLOW')}")
-    
-    # Read phase
+    if drop_caches_before_read and not drop_caches():
+        print_warning("Could not drop caches before the read phase (needs root)")
     if on_segment_change:
         on_segment_change(f"{threads}T-read")
-    print_info(f"Iteration {iteration_num}: Reading...")
-    start_time = time.time()
+    read_speed, pool_read_speed = _read_phase(
+        paths, bytes_per_thread, block_size_bytes, iteration_num, dataset_name,
+        engine, direct_read, executor, zfs_send, pin_threads=pin_threads, collector=collector
+    )
     
-    threads_list = []
-    for i in range(threads):
-        command = f"dd if={dataset_path}/{file_prefix}{i}.dat of=/dev/null bs={block_size} count={blocks_per_thread} status=none"
-        thread = threading.Thread(target=run_dd_command, args=(command,))
-        thread.start()
-        threads_list.append(thread)
+    # Cleanup immediately after read to free space
+    if not reuse_files:
+        _unlink_all(paths)
     
-    for thread in threads_list:
-        thread.join()
+    return write_speed, read_speed, bytes_written, pool_write_speed, pool_read_speed
+
+
+def run_overlapped_iterations(threads, labels, blocks_per_thread, block_size_bytes, file_prefix,
+                              dataset_path, seed_fd, on_segment_change=None, collector=None,
+                              sync_depth=0, engine="python", direct_read=False,
+                              direct_write=False, executor=None, zero_data=False,
+                              reuse_files=False, pin_threads=False):
+    """
+    Run several iterations with each read overlapping the next iteration's write.
     
-    end_time = time.time()
-    total_time_taken = end_time - start_time
+    Iterations alternate between two file sets ({file_prefix}A_ and
+    {file_prefix}B_), so iteration k is read back while iteration k+1 is
+    written. Keeps the pool's read and write paths busy together; the two
+    speeds of an iteration are then measured under each other's load and no
+    longer describe either direction alone. Needs space for two file sets.
     
-    read_speed = bytes_written / total_time_taken / (1024 * 1024)
+    Args:
+        threads: Number of concurrent threads per phase
+        labels: Iteration labels, in order (see run_single_iteration)
+        executor: Optional ThreadPoolExecutor with at least 2 * threads workers
+        (remaining arguments as for run_single_iteration)
     
-    print_info(f"Iteration {iteration_num} read: {color_text(f'{read_speed:.2f} MB/s', 'YELLOW')}")
+    Yields:
+        tuple: (label, (write_speed, read_speed, bytes_written, pool_write_speed,
+               pool_read_speed)) for each iteration once its read has finished
+    """
+    if executor is not None and executor._max_workers < 2 * threads:
+        # Read and write phases run at once; each needs all its workers idle
+        raise ValueError(
+            f"Executor has {executor._max_workers} workers but overlapped phases need {2 * threads}"
+        )
+    bytes_per_thread = blocks_per_thread * block_size_bytes
+    # Both file sets' paths, built once and reused by every phase and cleanup
+    file_sets = [test_file_paths(dataset_path, f"{file_prefix}{name}_", threads) for name in "AB"]
     
-    # Cleanup immediately after read to free space
-    cleanup_test_files(dataset_path, file_prefix, threads)
+    def write(index):
+        return _write_phase(
+            file_sets[index % 2], bytes_per_thread, block_size_bytes, labels[index], seed_fd, collector,
+            sync_depth, engine, direct_write, executor, zero_data, reuse_files,
+            pin_threads=pin_threads
+        )
+    
+    def read(index):
+        return _read_phase(
+            file_sets[index % 2], bytes_per_thread, block_size_bytes, labels[index],
+            engine=engine, direct_read=direct_read, executor=executor, pin_threads=pin_threads,
+            # Keep readers off the CPUs the concurrent writers are pinned to
+            cpu_offset=threads, collector=collector
+        )
     
-    return write_speed, read_speed, bytes_written
+    if not labels:
+        return
+    if on_segment_change:
+        on_segment_change(f"{threads}T-write")
+    written = write(0)
+    # One thread per phase; the phases' I/O workers come from executor
+    with ThreadPoolExecutor(max_workers=2) as phases:
+        for index, label in enumerate(labels):
+            if on_segment_change:
+                overlapped = index + 1 < len(labels)
+                on_segment_change(f"{threads}T-read+write" if overlapped else f"{threads}T-read")
+            read_future = phases.submit(read, index)
+            write_future = phases.submit(write, index + 1) if index + 1 < len(labels) else None
+            read_speed, pool_read_speed = read_future.result()
+            next_written = write_future.result() if write_future else None
+            if not reuse_files:
+                _unlink_all(file_sets[index % 2])
+            write_speed, bytes_written, pool_write_speed = written
+            yield label, (write_speed, read_speed, bytes_written, pool_write_speed, pool_read_speed)
+            written = next_written
 
 
 class ZFSPoolBenchmark(BenchmarkBase):
@@ -156,16 +584,70 @@ class ZFSPoolBenchmark(BenchmarkBase):
         collect_arcstat=True,
         zpool_iostat_interval=1,
         zpool_iostat_warmup=3,
-        zpool_iostat_cooldown=3
+        zpool_iostat_cooldown=3,
+        warmup=0,
+        sync_depth=0,
+        engine="python",
+        direct_read=False,
+        direct_write=False,
+        drop_caches_before_read=False,
+        stop_at_plateau=False,
+        data="random",
+        zfs_send=False,
+        overlap=False,
+        reuse_files=False,
+        pin_threads=False,
+        sweep="full",
+        dataset_name=None
     ):
         self.pool_name = pool_name
         self.cores = cores
         self.dataset_path = dataset_path
+        if dataset_name is None:
+            from core.dataset import bench_dataset_name
+            dataset_name = bench_dataset_name(pool_name)
+        # Full name of the dataset mounted at dataset_path, as create_dataset made it
+        self.dataset_name = dataset_name
         self.iterations = iterations
+        # Unrecorded iterations run first at every thread count (cold ARC, empty ZIL, SLC burst)
+        self.warmup = warmup
+        # Blocks per writer between fdatasync() calls; 0 leaves writes async
+        self.sync_depth = sync_depth
+        self.engine = self._resolve_engine(engine)
+        # ARC is deliberately in play by default; this reads around it
+        self.direct_read = direct_read
+        self.direct_write = direct_write
+        self.drop_caches_before_read = drop_caches_before_read
+        # Read phase streams a snapshot with zfs send instead of reading files
+        self.zfs_send = zfs_send
+        # Read each iteration back while the next one is written
+        self.overlap = self._resolve_overlap(overlap)
+        # Overwrite each thread count's files in place, deleting them once it is done
+        self.reuse_files = reuse_files
+        # Pin each worker to its own CPU for the length of a phase
+        self.pin_threads = pin_threads
+        # "fast" runs only the smallest and largest thread counts
+        self.sweep = sweep
+        # Skip larger thread counts once write speed stops changing
+        self.stop_at_plateau = stop_at_plateau
+        self.skipped_thread_counts = []
         self.block_size = block_size
         self.block_size_bytes = parse_block_size_to_bytes(block_size)
         self.blocks_per_thread = BYTES_PER_THREAD // self.block_size_bytes
         self.file_prefix = "file_"
+        # Seed generated once and sendfile()d by every writer; at least one
+        # block so large record sizes still fit
+        self.seed_bytes = max(SEED_BYTES, self.block_size_bytes)
+        self.data_source = self._resolve_data_source(data)
+        self.seed_fd = None
+        # Worker threads for the in-process engine, created once per run()
+        self._executor = None
+        # ARC ceiling, used to flag thread counts whose reads ARC could absorb
+        try:
+            from core.arcstat_collector import read_arc_max_bytes
+            self.arc_max_bytes = read_arc_max_bytes()
+        except ImportError:
+            self.arc_max_bytes = None
         
         # Zpool iostat collection settings
         self.collect_zpool_iostat = collect_zpool_iostat
@@ -174,6 +656,8 @@ class ZFSPoolBenchmark(BenchmarkBase):
         self.zpool_iostat_cooldown = zpool_iostat_cooldown
         self.zpool_iostat_collector = None
         self.zpool_iostat_telemetry = None
+        # Summary of zpool_iostat_telemetry, computed on first print and reused
+        self._zpool_iostat_summary = None
         
         # Arcstat collection settings
         self.collect_arcstat = collect_arcstat
@@ -190,8 +674,237 @@ class ZFSPoolBenchmark(BenchmarkBase):
         Calculate space required: 20 GiB per thread (single iteration).
         Space is freed between iterations, so we only need space for one iteration.
         """
-        max_threads = self.cores
-        return 20 * max_threads  # Only need space for one iteration at a time
+        max_threads = max(self._thread_counts())
+        # Overlapped iterations keep two file sets on disk at once
+        file_sets = 2 if self.overlap else 1
+        return 20 * max_threads * file_sets  # Only need space for one iteration at a time
+    
+    @staticmethod
+    def _resolve_engine(engine):
+        """Turn "auto" into "fio" or "python"; fall back to python if fio is missing."""
+        if engine == "python":
+            return engine
+        if fio_available():
+            return "fio"
+        if engine == "fio":
+            print_warning("fio not found on PATH - using the in-process I/O engine")
+        return "python"
+    
+    def _resolve_data_source(self, data):
+        """
+        Decide what the write phase writes: "random" or "zero".
+        
+        Zeros are only honest when the dataset does not compress (ZFS would
+        otherwise store them as holes), so a zero request falls back to
+        random data unless compression is confirmed off.
+        """
+        if data != "zero":
+            return "random"
+        try:
+            from core.dataset import get_dataset_compression
+            compression = get_dataset_compression(self.dataset_name)
+        except ImportError:
+            compression = None
+        if compression != "off":
+            print_warning(
+                f"Dataset compression is {compression or 'unknown'} - writing random data instead of zeros"
+            )
+            return "random"
+        return "zero"
+    
+    def _resolve_overlap(self, overlap):
+        """Turn off overlapped iterations where a read-phase option rules them out."""
+        if not overlap:
+            return False
+        if self.zfs_send:
+            print_warning("zfs send reads the whole dataset - running iterations without overlap")
+            return False
+        if self.drop_caches_before_read:
+            print_warning("Caches cannot be dropped while a write is running - running iterations without overlap")
+            return False
+        return True
+    
+    def _thread_counts(self):
+        """1, cores/4, cores/2 and cores threads (fast sweep: 1 and cores), without repeats."""
+        cores = max(1, self.cores)
+        if self.sweep == "fast":
+            return sorted({1, cores})
+        return sorted({1, max(1, cores // 4), max(1, cores // 2), cores})
+    
+    def _plateaued(self, results, thread_counts):
+        """
+        Decide whether to stop after the latest thread count.
+        
+        Records the thread counts that will be skipped.
+        
+        Returns:
+            bool: True if stop_at_plateau is enabled, write speed moved less
+                  than PLATEAU_RATIO since the previous thread count, and
+                  larger thread counts remain
+        """
+        if not self.stop_at_plateau or len(results) < 2:
+            return False
+        previous = results[-2]["average_write_speed"]
+        current = results[-1]["average_write_speed"]
+        remaining = thread_counts[len(results):]
+        if not remaining or previous <= 0 or abs(current - previous) / previous >= PLATEAU_RATIO:
+            return False
+        self.skipped_thread_counts = remaining
+        print_info(
+            f"Write speed within {PLATEAU_RATIO:.0%} of the previous thread count; "
+            f"skipping {', '.join(map(str, remaining))} threads"
+        )
+        return True
+    
+    def _warn_if_arc_sized(self, threads):
+        """Warn when a thread count's working set is small enough for ARC to serve its reads."""
+        if self.arc_max_bytes is None or self.direct_read or self.drop_caches_before_read:
+            return
+        working_set = threads * self.blocks_per_thread * self.block_size_bytes
+        if working_set < 2 * self.arc_max_bytes:
+            print_warning(
+                f"{threads} thread(s) write {working_set / 1024**3:.0f} GiB, less than 2x ARC max "
+                f"({self.arc_max_bytes / 1024**3:.0f} GiB); read speeds may be ARC hits"
+            )
+    
+    def _announce_iteration(self, iteration):
+        """
+        Print the banner for an iteration and return its short label.
+        
+        Iterations numbered 0 and below are warmups, which are run but not recorded.
+        """
+        if iteration > 0:
+            print_info(f"--- Iteration {iteration} of {self.iterations} ---")
+            return iteration
+        warmup_num = iteration + self.warmup
+        print_info(f"--- Warmup iteration {warmup_num} of {self.warmup} (not recorded) ---")
+        return f"W{warmup_num}"
+    
+    def _iterations(self, threads, on_segment_change=None):
+        """
+        Run every iteration (warmups first) for one thread count.
+        
+        Yields:
+            tuple: (iteration, label, run_single_iteration() result); iteration
+                   numbers 0 and below are warmups
+        """
+        iterations = range(1 - self.warmup, self.iterations + 1)
+        if not self.overlap:
+            for iteration in iterations:
+                label = self._announce_iteration(iteration)
+                yield iteration, label, run_single_iteration(
+                    threads, self.blocks_per_thread, self.block_size,
+                    self.block_size_bytes, self.file_prefix, self.dataset_path,
+                    label, self.seed_fd, on_segment_change=on_segment_change,
+                    dataset_name=self.dataset_name, sync_depth=self.sync_depth,
+                    engine=self.engine, direct_read=self.direct_read,
+                    direct_write=self.direct_write, executor=self._executor,
+                    drop_caches_before_read=self.drop_caches_before_read,
+                    zero_data=self.data_source == "zero",
+                    zfs_send=self.zfs_send, reuse_files=self.reuse_files,
+                    pin_threads=self.pin_threads, collector=self.zpool_iostat_collector,
+                )
+            self._remove_reused_files(threads)
+            return
+        labels = [iteration if iteration > 0 else f"W{iteration + self.warmup}" for iteration in iterations]
+        print_info(
+            f"--- {len(labels)} iterations ({self.warmup} warmup), "
+            "each read overlapping the next write ---"
+        )
+        overlapped = run_overlapped_iterations(
+            threads, labels, self.blocks_per_thread, self.block_size_bytes,
+            self.file_prefix, self.dataset_path, self.seed_fd,
+            on_segment_change=on_segment_change, collector=self.zpool_iostat_collector,
+            sync_depth=self.sync_depth, engine=self.engine,
+            direct_read=self.direct_read, direct_write=self.direct_write,
+            executor=self._executor, zero_data=self.data_source == "zero",
+            reuse_files=self.reuse_files, pin_threads=self.pin_threads,
+        )
+        for iteration, (label, outcome) in zip(iterations, overlapped):
+            yield iteration, label, outcome
+        self._remove_reused_files(threads)
+    
+    def _remove_reused_files(self, threads):
+        """Delete a thread count's files once its last iteration is done (reuse_files only)."""
+        if not self.reuse_files:
+            return
+        prefixes = [f"{self.file_prefix}{name}_" for name in "AB"] if self.overlap else [self.file_prefix]
+        for prefix in prefixes:
+            cleanup_test_files(self.dataset_path, prefix, threads)
+        print_info(f"Space freed after {threads} thread(s)")
+    
+    def _run_thread_count(self, threads, on_segment_change=None, on_last_iteration=None):
+        """
+        Run every iteration for one thread count and summarise it.
+        
+        Args:
+            threads: Number of concurrent threads
+            on_segment_change: Optional callback(label: str) passed to each iteration
+            on_last_iteration: Optional callback() run right after the last
+                               recorded iteration, before any reused files are removed
+        
+        Returns:
+            tuple: (result dict for benchmark_results, bytes written including warmups)
+        """
+        print_section(f"Testing Pool: {self.pool_name} - Threads: {threads}")
+        self._warn_if_arc_sized(threads)
+        
+        write_speeds = []
+        read_speeds = []
+        pool_write_speeds = []
+        pool_read_speeds = []
+        bytes_written_for_config = 0
+        total_bytes_written = 0
+        
+        # Run iterations with cleanup after each
+        for iteration, label, outcome in self._iterations(threads, on_segment_change):
+            (write_speed, read_speed, bytes_written,
+             pool_write_speed, pool_read_speed) = outcome
+            total_bytes_written += bytes_written
+            if not self.reuse_files:
+                print_info(f"Space freed after iteration {label}")
+            if iteration > 0:
+                write_speeds.append(write_speed)
+                read_speeds.append(read_speed)
+                pool_write_speeds.append(pool_write_speed)
+                pool_read_speeds.append(pool_read_speed)
+                bytes_written_for_config += bytes_written
+            if iteration == self.iterations and on_last_iteration:
+                on_last_iteration()
+        
+        average_write_speed = fmean(write_speeds) if write_speeds else 0.0
+        average_read_speed = fmean(read_speeds) if read_speeds else 0.0
+        # Spread between recorded iterations (0 with fewer than two)
+        write_speed_stdev = stdev(write_speeds) if len(write_speeds) > 1 else 0.0
+        read_speed_stdev = stdev(read_speeds) if len(read_speeds) > 1 else 0.0
+        
+        result = {
+            "threads": threads,
+            "write_speeds": write_speeds,
+            "average_write_speed": average_write_speed,
+            "write_speed_stdev": write_speed_stdev,
+            "read_speeds": read_speeds,
+            "average_read_speed": average_read_speed,
+            "read_speed_stdev": read_speed_stdev,
+            "pool_write_speeds": pool_write_speeds,
+            "pool_read_speeds": pool_read_speeds,
+            "iterations": self.iterations,
+            "sync_depth": self.sync_depth,
+            "engine": self.engine,
+            "direct_read": self.direct_read,
+            "direct_write": self.direct_write,
+            "drop_caches_before_read": self.drop_caches_before_read,
+            "data_source": self.data_source,
+            "zfs_send": self.zfs_send,
+            "overlapped": self.overlap,
+            "reuse_files": self.reuse_files,
+            "pin_threads": self.pin_threads,
+            "sweep": self.sweep,
+            "bytes_written": bytes_written_for_config
+        }
+        if self.warmup:
+            result["warmup_iterations"] = self.warmup
+        return result, total_bytes_written
     
     def _run_benchmark_with_zpool_iostat(self):
         """
@@ -218,8 +931,7 @@ class ZFSPoolBenchmark(BenchmarkBase):
             except ImportError:
                 print_info("Arcstat collector not available, running without ARC telemetry")
         
-        escaped_pool_name = self.pool_name.replace(" ", "\\ ")
-        thread_counts = [1, self.cores // 4, self.cores // 2, self.cores]
+        thread_counts = self._thread_counts()
         results = []
         total_bytes_written = 0
         
@@ -262,46 +974,24 @@ class ZFSPoolBenchmark(BenchmarkBase):
         try:
             # Run the benchmark
             for threads in thread_counts:
-                print_section(f"Testing Pool: {escaped_pool_name} - Threads: {threads}")
+                # Signal benchmark start before the first iteration of the first thread count
+                if threads == thread_counts[0] and self.zpool_iostat_collector:
+                    self.zpool_iostat_collector.signal_benchmark_start()
                 
-                write_speeds = []
-                read_speeds = []
-                bytes_written_for_config = 0
+                # Signal benchmark end on last iteration of last thread count
+                on_last_iteration = None
+                if threads == thread_counts[-1] and self.zpool_iostat_collector:
+                    on_last_iteration = self.zpool_iostat_collector.signal_benchmark_end
                 
-                for iteration in range(1, self.iterations + 1):
-                    print_info(f"--- Iteration {iteration} of {self.iterations} ---")
-                    
-                    # Signal benchmark start on first iteration of first thread count
-                    if iteration == 1 and threads == thread_counts[0] and self.zpool_iostat_collector:
-                        self.zpool_iostat_collector.signal_benchmark_start()
-                    
-                    write_speed, read_speed, bytes_written = run_single_iteration(
-                        threads, self.blocks_per_thread, self.block_size,
-                        self.block_size_bytes, self.file_prefix, self.dataset_path,
-                        iteration, on_segment_change=_on_segment_change,
-                    )
-                    write_speeds.append(write_speed)
-                    read_speeds.append(read_speed)
-                    bytes_written_for_config += bytes_written
-                    total_bytes_written += bytes_written
-                    print_info(f"Space freed after iteration {iteration}")
-                    
-                    # Signal benchmark end on last iteration of last thread count
-                    if iteration == self.iterations and threads == thread_counts[-1] and self.zpool_iostat_collector:
+                result, bytes_written = self._run_thread_count(
+                    threads, _on_segment_change, on_last_iteration
+                )
+                total_bytes_written += bytes_written
+                results.append(result)
+                if self._plateaued(results, thread_counts):
+                    if self.zpool_iostat_collector:
                         self.zpool_iostat_collector.signal_benchmark_end()
-                
-                average_write_speed = sum(write_speeds) / len(write_speeds) if write_speeds else 0
-                average_read_speed = sum(read_speeds) / len(read_speeds) if read_speeds else 0
-                
-                results.append({
-                    "threads": threads,
-                    "write_speeds": write_speeds,
-                    "average_write_speed": average_write_speed,
-                    "read_speeds": read_speeds,
-                    "average_read_speed": average_read_speed,
-                    "iterations": self.iterations,
-                    "bytes_written": bytes_written_for_config
-                })
+                    break
         
         except KeyboardInterrupt:
             print_info("\nBenchmark interrupted by user")
@@ -312,6 +1002,7 @@ class ZFSPoolBenchmark(BenchmarkBase):
                 self.zpool_iostat_telemetry = self.zpool_iostat_collector.stop(
                     cooldown_iterations=self.zpool_iostat_cooldown
                 )
+                self._zpool_iostat_summary = None
             if self.arcstat_collector:
                 self.arcstat_telemetry = self.arcstat_collector.stop(
                     cooldown_iterations=self.zpool_iostat_cooldown
@@ -319,15 +1010,16 @@ class ZFSPoolBenchmark(BenchmarkBase):
         
         # Print zpool iostat summary if available
         if self.zpool_iostat_telemetry:
-            self._print_inline_telemetry_summary(escaped_pool_name)
+            self._print_inline_telemetry_summary(self.pool_name)
         
         # Print arcstat summary if available
         if self.arcstat_telemetry:
-            self._print_inline_arcstat_summary(escaped_pool_name)
+            self._print_inline_arcstat_summary(self.pool_name)
         
         return {
             "benchmark_results": results,
             "total_bytes_written": total_bytes_written,
+            "skipped_thread_counts": self.skipped_thread_counts,
             "zpool_iostat_telemetry": self.zpool_iostat_telemetry.to_dict(sample_interval=5) if self.zpool_iostat_telemetry else None,
             "arcstat_telemetry": self.arcstat_telemetry.to_dict(sample_interval=5) if self.arcstat_telemetry else None,
         }
@@ -339,53 +1031,26 @@ class ZFSPoolBenchmark(BenchmarkBase):
         Returns:
             dict: Benchmark results
         """
-        escaped_pool_name = self.pool_name.replace(" ", "\\ ")
-        thread_counts = [1, self.cores // 4, self.cores // 2, self.cores]
+        thread_counts = self._thread_counts()
         results = []
         total_bytes_written = 0
         
         for threads in thread_counts:
-            print_section(f"Testing Pool: {escaped_pool_name} - Threads: {threads}")
-            
-            write_speeds = []
-            read_speeds = []
-            bytes_written_for_config = 0
-            
-            # Run iterations sequentially with cleanup between each
-            for iteration in range(1, self.iterations + 1):
-                print_info(f"--- Iteration {iteration} of {self.iterations} ---")
-                write_speed, read_speed, bytes_written = run_single_iteration(
-                    threads, self.blocks_per_thread, self.block_size,
-                    self.block_size_bytes, self.file_prefix, self.dataset_path,
-                    iteration
-                )
-                write_speeds.append(write_speed)
-                read_speeds.append(read_speed)
-                bytes_written_for_config += bytes_written
-                total_bytes_written += bytes_written
-                print_info(f"Space freed after iteration {iteration}")
-            
-            average_write_speed = sum(write_speeds) / len(write_speeds) if write_speeds else 0
-            average_read_speed = sum(read_speeds) / len(read_speeds) if read_speeds else 0
-            
-            results.append({
-                "threads": threads,
-                "write_speeds": write_speeds,
-                "average_write_speed": average_write_speed,
-                "read_speeds": read_speeds,
-                "average_read_speed": average_read_speed,
-                "iterations": self.iterations,
-                "bytes_written": bytes_written_for_config
-            })
+            result, bytes_written = self._run_thread_count(threads)
+            total_bytes_written += bytes_written
+            results.append(result)
+            if self._plateaued(results, thread_counts):
+                break
         
         return {
             "benchmark_results": results,
-            "total_bytes_written": total_bytes_written
+            "total_bytes_written": total_bytes_written,
+            "skipped_thread_counts": self.skipped_thread_counts
         }
     
     def run(self, config: dict = None) -> dict:
         """
-        Run the ZFS pool benchmark across four thread-count configurations.
+        Run the ZFS pool benchmark across up to four thread-count configurations.
         
         If collect_zpool_iostat is True (default), collects zpool iostat telemetry
         during the benchmark with warmup and cooldown periods.
@@ -396,6 +1061,17 @@ class ZFSPoolBenchmark(BenchmarkBase):
         Returns:
             dict: Results containing thread counts, speeds, metadata, and zpool iostat telemetry.
         """
+        if self.engine == "python" and self.seed_fd is None:
+            self.seed_fd = create_seed_fd(
+                self.seed_bytes, random_data=self.data_source == "random"
+            )
+        if self.engine == "python" and self._executor is None:
+            # Sized for the largest thread count so every worker runs at once
+            # (twice over when a read and a write phase run together);
+            # _run_phase() refuses to start a phase it could not fit
+            phases = 2 if self.overlap else 1
+            self._executor = ThreadPoolExecutor(max_workers=max(self._thread_counts()) * phases)
+        
         if self.collect_zpool_iostat:
             return self._run_benchmark_with_zpool_iostat()
         else:
@@ -408,8 +1084,7 @@ class ZFSPoolBenchmark(BenchmarkBase):
         Args:
             results: The results dictionary from run()
         """
-        escaped_pool_name = self.pool_name.replace(" ", "\\ ")
-        print_header(f"DD Benchmark Results for Pool: {escaped_pool_name}")
+        print_header(f"Pool Benchmark Results: {self.pool_name}")
         
         for result in results["benchmark_results"]:
             print_subheader(f"Threads: {result['threads']}")
@@ -429,30 +1104,39 @@ class ZFSPoolBenchmark(BenchmarkBase):
             for i, speed in enumerate(read_speeds):
                 print_bullet(f"{bs_label} Seq Read Run {i+1}: {color_text(f'{speed:.2f} MB/s', 'YELLOW')}")
             print_bullet(f"{bs_label} Seq Read Avg: {color_text(f'{avg_read:.2f} MB/s', 'GREEN')}")
+            
+            # What zpool iostat saw on the vdevs; reads served from ARC do not show up here
+            for label, key in (("Write", "pool_write_speeds"), ("Read", "pool_read_speeds")):
+                sampled = [speed for speed in result.get(key, []) if speed is not None]
+                if sampled:
+                    pool_avg = fmean(sampled)
+                    print_bullet(f"Pool-reported {label} Avg: {color_text(f'{pool_avg:.2f} MB/s', 'CYAN')}")
         
         # Print zpool iostat summary if available
         if self.zpool_iostat_telemetry:
             self._print_zpool_iostat_summary()
     
-    def _print_inline_telemetry_summary(self, escaped_pool_name: str):
+    def _print_inline_telemetry_summary(self, pool_name: str):
         """Print telemetry summary immediately after benchmark (uses unified formatter)."""
         from core.zpool_iostat_collector import calculate_zpool_iostat_summary
         from core.telemetry_formatter import format_telemetry_for_console
 
-        print_section(f"Zpool Iostat Telemetry Summary for Pool: {escaped_pool_name}")
-        summary = calculate_zpool_iostat_summary(self.zpool_iostat_telemetry)
-        output = format_telemetry_for_console(summary, escaped_pool_name)
+        print_section(f"Zpool Iostat Telemetry Summary for Pool: {pool_name}")
+        # print_summary() prints this again after run() did; summarise only once
+        if self._zpool_iostat_summary is None:
+            self._zpool_iostat_summary = calculate_zpool_iostat_summary(self.zpool_iostat_telemetry)
+        output = format_telemetry_for_console(self._zpool_iostat_summary, pool_name)
         print(output)
 
-    def _print_inline_arcstat_summary(self, escaped_pool_name: str):
+    def _print_inline_arcstat_summary(self, pool_name: str):
         """Print ARC statistics summary immediately after benchmark."""
         try:
             from core.arcstat_collector import calculate_arcstat_summary
             from core.arcstat_formatter import format_arcstat_for_console
 
-            print_section(f"ARC Statistics Summary (READ Phase) for Pool: {escaped_pool_name}")
+            print_section(f"ARC Statistics Summary (READ Phase) for Pool: {pool_name}")
             summary = calculate_arcstat_summary(self.arcstat_telemetry)
-            output = format_arcstat_for_console(summary, escaped_pool_name)
+            output = format_arcstat_for_console(summary, pool_name)
             print(output)
         except Exception as e:
             print_warning(f"Error generating ARC summary: {e}")
@@ -464,8 +1148,7 @@ class ZFSPoolBenchmark(BenchmarkBase):
         if not self.zpool_iostat_telemetry:
             return
         try:
-            escaped_pool_name = self.pool_name.replace(" ", "\\ ")
-            self._print_inline_telemetry_summary(escaped_pool_name)
+            self._print_inline_telemetry_summary(self.pool_name)
         except ImportError as e:
             print_bullet(f"Import error: {e}")
             print_bullet(f"Total samples collected: {len(self.zpool_iostat_telemetry.samples)}")
@@ -485,9 +1168,20 @@ class ZFSPoolBenchmark(BenchmarkBase):
     def cleanup(self):
         """Remove any remaining test files (safety cleanup)."""
         print_info("Cleaning up any remaining test files...")
-        thread_counts = [1, self.cores // 4, self.cores // 2, self.cores]
-        max_threads = max(thread_counts)
-        for i in range(max_threads):
-            file_path = f"{self.dataset_path}/{self.file_prefix}{i}.dat"
-            if os.path.exists(file_path):
-                os.remove(file_path)
+        # Sweep the directory once instead of probing every possible file name
+        try:
+            with os.scandir(self.dataset_path) as entries:
+                leftovers = [
+                    entry.path for entry in entries
+                    if entry.name.startswith(self.file_prefix) and entry.name.endswith(".dat")
+                ]
+        except FileNotFoundError:
+            leftovers = []
+        _unlink_all(leftovers)
+        
+        if self.seed_fd is not None:
+            os.close(self.seed_fd)
+            self.seed_fd = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -21,7 +21,8 @@ from core.arcstat_collector import (
     ArcstatSample,
     ArcstatTelemetry,
     calculate_arcstat_summary,
-    detect_l2arc
+    detect_l2arc,
+    read_arc_max_bytes
 )
 
 
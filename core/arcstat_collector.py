@@ -98,6 +98,31 @@ def detect_l2arc(pool_name: str) -> bool:
         return False
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# ARC Size
+# ═══════════════════════════════════════════════════════════════════════════
+
+ARCSTATS_PATH = "/proc/spl/kstat/zfs/arcstats"
+
+
+def read_arc_max_bytes() -> Optional[int]:
+    """
+    Read the ARC's maximum size (``c_max``) from the kernel kstats.
+
+    Returns:
+        ARC max in bytes, or None if ZFS kstats are unavailable.
+    """
+    try:
+        with open(ARCSTATS_PATH) as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 3 and fields[0] == "c_max":
+                    return int(fields[2])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Unit Conversion
 # ═══════════════════════════════════════════════════════════════════════════
@@ -65,15 +65,17 @@ def get_std_dev_rating(std_dev: float) -> Tuple[str, str]:
 # Color Helper
 # ═══════════════════════════════════════════════════════════════════════════
 
+_COLORS = {
+    "GREEN": "\033[92m", "CYAN": "\033[96m", "YELLOW": "\033[93m",
+    "RED": "\033[91m", "BOLD": "\033[1m", "DIM": "\033[2m",
+    "WHITE": "\033[97m", "BLUE": "\033[94m", "MAGENTA": "\033[95m",
+    "RESET": "\033[0m",
+}
+
+
 def _color(text: str, color: str) -> str:
     """Apply ANSI color to text."""
-    colors = {
-        "GREEN": "\033[92m", "CYAN": "\033[96m", "YELLOW": "\033[93m",
-        "RED": "\033[91m", "BOLD": "\033[1m", "DIM": "\033[2m",
-        "WHITE": "\033[97m", "BLUE": "\033[94m", "MAGENTA": "\033[95m",
-        "RESET": "\033[0m",
-    }
-    return f"{colors.get(color, '')}{text}{colors['RESET']}"
+    return f"{_COLORS.get(color, '')}{text}{_COLORS['RESET']}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
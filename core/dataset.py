@@ -21,6 +21,11 @@ def get_datasets():
     return []
 
 
+def bench_dataset_name(pool_name):
+    """Full name of the tn-bench test dataset in pool_name (e.g. "tank/tn-bench")."""
+    return f"{pool_name}/tn-bench"
+
+
 def create_dataset(pool_name, recordsize="1M"):
     """
     Create a test dataset in the specified pool.
@@ -34,8 +39,7 @@ def create_dataset(pool_name, recordsize="1M"):
         str: Mountpoint of the created dataset, or None if failed.
     """
     # Escape spaces in the pool name
-    escaped_pool_name = pool_name.replace(" ", "\\ ")
-    dataset_name = f"{escaped_pool_name}/tn-bench"
+    dataset_name = bench_dataset_name(pool_name).replace(" ", "\\ ")
     # TrueNAS API requires uppercase unit suffix (K, M) not lowercase (k, m)
     recordsize_api = recordsize.upper()
     dataset_config = {
@@ -147,6 +151,26 @@ def delete_dataset(dataset_name):
         print_success("Dataset deleted successfully")
 
 
+def get_dataset_compression(dataset_name):
+    """
+    Get the compression setting of the test dataset.
+    
+    Args:
+        dataset_name: Full name of the dataset (see bench_dataset_name)
+    
+    Returns:
+        str: Compression value (e.g. "off", "lz4"), or None if it can't be read.
+    """
+    try:
+        result = subprocess.run(['zfs', 'get', '-H', '-o', 'value', 'compression', dataset_name],
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().lower() or None
+
+
 def get_dataset_available_bytes(pool_name):
     """
     Get available space in the test dataset.
@@ -154,7 +178,7 @@ def get_dataset_available_bytes(pool_name):
     Returns:
         int: Available bytes, or 0 if dataset not found.
     """
-    dataset_name = f"{pool_name}/tn-bench"
+    dataset_name = bench_dataset_name(pool_name)
     result = subprocess.run(['midclt', 'call', 'pool.dataset.query'], capture_output=True, text=True)
     if result.returncode != 0:
         print_error(f"Error querying datasets: {result.stderr}")
@@ -190,7 +214,7 @@ def get_dataset_available_bytes(pool_name):
     return 0
 
 
-def validate_space(pool_name, cores, iterations):
+def validate_space(pool_name, cores, iterations, overlap=False):
     """
     Validate that sufficient space exists for benchmarking.
     
@@ -198,14 +222,16 @@ def validate_space(pool_name, cores, iterations):
         pool_name: Name of the pool to check
         cores: Number of CPU cores (determines thread count)
         iterations: Number of iterations to run (not used for space calc - space is freed between iterations)
+        overlap: Iterations overlap, so two iterations' files exist at once
         
     Returns:
         tuple: (has_space, available_gib, required_gib)
     """
     available_bytes = get_dataset_available_bytes(pool_name)
     # Space is freed between iterations, so we only need space for one iteration
-    required_bytes = 20 * cores * (1024 ** 3)
+    file_sets = 2 if overlap else 1
+    required_bytes = 20 * cores * file_sets * (1024 ** 3)
     available_gib = available_bytes / (1024 ** 3)
-    required_gib = 20 * cores
+    required_gib = 20 * cores * file_sets
     
     return available_bytes >= required_bytes, available_gib, required_gib
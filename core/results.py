@@ -75,7 +75,12 @@ def save_results_to_json(results, output_path, start_time, end_time):
                         "average_read_speed": round(bench["average_read_speed"], 2),
                         "iterations": bench["iterations"]
                     }
+                    for key in ("write_speed_stdev", "read_speed_stdev"):
+                        if key in bench:
+                            bench_entry[key] = round(bench[key], 2)
                     pool_entry["benchmark"].append(bench_entry)
+            if pool.get("skipped_thread_counts"):
+                pool_entry["skipped_thread_counts"] = pool["skipped_thread_counts"]
             
             # Add zpool iostat telemetry if available
             if "zpool_iostat_telemetry" in pool and pool["zpool_iostat_telemetry"]:
@@ -142,6 +147,8 @@ def save_results_to_json(results, output_path, start_time, end_time):
                     "average_speed": round(bench.get("average_speed", 0), 2),
                     "iterations": bench.get("iterations", 0)
                 }
+                if bench.get("latency_us"):
+                    disk_entry["benchmark"]["latency_us"] = bench["latency_us"]
             
             transformed_results["disks"].append(disk_entry)
         
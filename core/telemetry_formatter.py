@@ -24,6 +24,14 @@ class FormatConfig:
     include_read_metrics: bool = False  # READ metrics (excluded due to ZFS ARC)
 
 
+def segment_thread_count(label: str) -> Optional[int]:
+    """Thread count from a segment label like "16T-write", or None if it has none."""
+    try:
+        return int(label.split('T')[0])
+    except ValueError:
+        return None
+
+
 def get_cv_rating(cv: float) -> Tuple[str, str]:
     """
     Get CV% rating label and color.
@@ -95,21 +103,23 @@ def get_std_dev_rating(std_dev: float, metric_type: str = "iops") -> Tuple[str,
             return ("High Variance", "RED")
 
 
+ANSI_COLORS = {
+    "GREEN": "\033[92m",
+    "CYAN": "\033[96m",
+    "YELLOW": "\033[93m",
+    "RED": "\033[91m",
+    "BOLD": "\033[1m",
+    "DIM": "\033[2m",
+    "WHITE": "\033[97m",
+    "BLUE": "\033[94m",
+    "MAGENTA": "\033[95m",
+    "RESET": "\033[0m"
+}
+
+
 def color_text(text: str, color: str) -> str:
     """Apply ANSI color to text (console only)."""
-    colors = {
-        "GREEN": "\033[92m",
-        "CYAN": "\033[96m",
-        "YELLOW": "\033[93m",
-        "RED": "\033[91m",
-        "BOLD": "\033[1m",
-        "DIM": "\033[2m",
-        "WHITE": "\033[97m",
-        "BLUE": "\033[94m",
-        "MAGENTA": "\033[95m",
-        "RESET": "\033[0m"
-    }
-    return f"{colors.get(color, '')}{text}{colors['RESET']}"
+    return f"{ANSI_COLORS.get(color, '')}{text}{ANSI_COLORS['RESET']}"
 
 
 class TelemetryFormatter:
@@ -233,16 +243,9 @@ class TelemetryFormatter:
         # Only show write phases, sorted numerically by thread count
         write_phases = [(label, data) for label, data in per_seg.items() if label.endswith('-write')]
 
-        # Extract thread count and sort numerically
-        def get_thread_count(item):
-            label = item[0]
-            # Extract number from "16T-write" format
-            try:
-                return int(label.split('T')[0])
-            except (ValueError, IndexError):
-                return 0
-
-        for seg_label, seg_data in sorted(write_phases, key=get_thread_count):
+        # Sort numerically by thread count (unparseable labels first)
+        for seg_label, seg_data in sorted(write_phases,
+                                          key=lambda item: segment_thread_count(item[0]) or 0):
             self._format_segment(seg_label, seg_data)
 
         self._add()
@@ -263,11 +266,8 @@ class TelemetryFormatter:
         write_latency = latency_data.get('total_wait_write', {})
         
         # Convert "16T-write" to "16 Threads" format for display
-        try:
-            thread_count = int(seg_label.split('T')[0])
-            display_label = f"{thread_count} Threads"
-        except (ValueError, IndexError):
-            display_label = seg_label
+        thread_count = segment_thread_count(seg_label)
+        display_label = f"{thread_count} Threads" if thread_count is not None else seg_label
         
         # Only show if we have meaningful write data (lower threshold for 1T)
         if not write_iops or write_iops.get('mean', 0) < 10:
@@ -27,7 +27,7 @@ from core import (
     get_pool_info, print_pool_info_table,
     get_disk_info, get_pool_membership, print_disk_info_table
 )
-from core.dataset import create_dataset, delete_dataset, validate_space
+from core.dataset import bench_dataset_name, create_dataset, delete_dataset, validate_space
 from core.results import save_results_to_json
 from core.analytics import ResultAnalyzer
 from core.report_generator import generate_markdown_report
@@ -49,6 +49,14 @@ VALID_DISK_MODES = {"serial", "parallel", "seek_stress"}
 
 # ── Argument parsing ─────────────────────────────────────────────────────
 
+def non_negative_int(value):
+    """argparse type for counts where 0 means "off" and negatives make no sense."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more (got {number})")
+    return number
+
+
 def build_parser():
     """Build the argument parser with all CLI options."""
     parser = argparse.ArgumentParser(
@@ -86,6 +94,32 @@ unattended mode examples:
                         help='Number of ZFS pool benchmark iterations (0-100, 0=skip; default: 2)')
     parser.add_argument('--pool-block-size', type=str, default=None,
                         help='Pool benchmark block size: 16K, 32K, 64K, 128K, 256K, 512K, 1M, 2M, 4M, 8M, 16M (default: 1M)')
+    parser.add_argument('--pool-engine', type=str, default=None, choices=['auto', 'python', 'fio'],
+                        help="Pool I/O engine: python (in-process sendfile()), fio, or auto (fio if installed) (default: python)")
+    parser.add_argument('--pool-direct-read', action='store_true', default=False,
+                        help='Read pool test files with O_DIRECT so the read phase bypasses ARC')
+    parser.add_argument('--pool-direct-write', action='store_true', default=False,
+                        help='Write pool test files with O_DIRECT so the write phase bypasses ARC')
+    parser.add_argument('--pool-data', type=str, default=None, choices=['random', 'zero'],
+                        help="Pool write data: random, or zero (only honoured when dataset compression is off) (default: random)")
+    parser.add_argument('--pool-drop-caches', action='store_true', default=False,
+                        help='Drop the page cache / ARC between each pool write and read phase')
+    parser.add_argument('--pool-zfs-send', action='store_true', default=False,
+                        help='Measure pool reads by streaming a snapshot with zfs send to /dev/null instead of reading the files')
+    parser.add_argument('--pool-overlap', action='store_true', default=False,
+                        help="Read each pool iteration back while the next one is written (needs twice the space)")
+    parser.add_argument('--pool-reuse-files', action='store_true', default=False,
+                        help="Overwrite pool test files in place across a thread count's iterations instead of recreating them")
+    parser.add_argument('--pool-pin-threads', action='store_true', default=False,
+                        help='Pin each pool worker thread (or fio job) to its own CPU')
+    parser.add_argument('--pool-sweep', type=str, default=None, choices=['full', 'fast'],
+                        help='Pool thread counts: full (1, N/4, N/2, N) or fast (1 and N only) (default: full)')
+    parser.add_argument('--pool-max-threads', type=non_negative_int, default=None,
+                        help='Cap the largest pool thread count below the core count (0=no cap; default: 0)')
+    parser.add_argument('--pool-stop-at-plateau', action='store_true', default=False,
+                        help='Skip larger pool thread counts once write speed changes by less than 5%%')
+    parser.add_argument('--pool-sync-depth', type=int, default=None,
+                        help='Blocks each pool writer writes between fdatasync() calls (0-1024, 0=no syncs; default: 0)')
 
     # Disk benchmark options
     parser.add_argument('--disk-iterations', type=int, default=None,
@@ -97,6 +131,10 @@ unattended mode examples:
     parser.add_argument('--seek-threads', type=int, default=None,
                         help='Threads per disk for seek_stress mode (1-32, default: 4)')
 
+    # Applies to both pool and disk benchmarks
+    parser.add_argument('--warmup-iterations', type=int, default=None,
+                        help='Unrecorded warmup iterations run before the measured ones (0-10, default: 0)')
+
     # Safety confirmation
     parser.add_argument('--confirm', action='store_true', default=False,
                         help='Auto-confirm the safety prompt (required for --unattended)')
@@ -167,6 +205,14 @@ def validate_unattended_args(args):
     if args.seek_threads is not None and not (1 <= args.seek_threads <= 32):
         errors.append(f"--seek-threads must be 1-32 (got {args.seek_threads})")
 
+    # Validate pool sync depth
+    if args.pool_sync_depth is not None and not (0 <= args.pool_sync_depth <= 1024):
+        errors.append(f"--pool-sync-depth must be 0-1024 (got {args.pool_sync_depth})")
+
+    # Validate warmup iterations
+    if args.warmup_iterations is not None and not (0 <= args.warmup_iterations <= 10):
+        errors.append(f"--warmup-iterations must be 0-10 (got {args.warmup_iterations})")
+
     # If disk iterations > 0 and disk-modes includes seek_stress, seek-threads is used (but has a default)
     # No error needed — default of 4 is applied later
 
@@ -324,6 +370,76 @@ def _validate_config(config):
         if st is not None and (not isinstance(st, int) or not (1 <= st <= 32)):
             errors.append(f"[{label}] seek_threads must be 1-32 (got {st})")
 
+        # pool_engine
+        pe = section.get('pool_engine')
+        if pe is not None and pe not in ('auto', 'python', 'fio'):
+            errors.append(f"[{label}] pool_engine must be auto, python or fio (got {pe})")
+
+        # pool_direct_read
+        pdr = section.get('pool_direct_read')
+        if pdr is not None and not isinstance(pdr, bool):
+            errors.append(f"[{label}] pool_direct_read must be true or false (got {pdr})")
+
+        # pool_direct_write
+        pdw = section.get('pool_direct_write')
+        if pdw is not None and not isinstance(pdw, bool):
+            errors.append(f"[{label}] pool_direct_write must be true or false (got {pdw})")
+
+        # pool_data
+        pd = section.get('pool_data')
+        if pd is not None and pd not in ('random', 'zero'):
+            errors.append(f"[{label}] pool_data must be random or zero (got {pd})")
+
+        # pool_drop_caches
+        pdc = section.get('pool_drop_caches')
+        if pdc is not None and not isinstance(pdc, bool):
+            errors.append(f"[{label}] pool_drop_caches must be true or false (got {pdc})")
+
+        # pool_zfs_send
+        pzs = section.get('pool_zfs_send')
+        if pzs is not None and not isinstance(pzs, bool):
+            errors.append(f"[{label}] pool_zfs_send must be true or false (got {pzs})")
+
+        # pool_overlap
+        po = section.get('pool_overlap')
+        if po is not None and not isinstance(po, bool):
+            errors.append(f"[{label}] pool_overlap must be true or false (got {po})")
+
+        # pool_reuse_files
+        prf = section.get('pool_reuse_files')
+        if prf is not None and not isinstance(prf, bool):
+            errors.append(f"[{label}] pool_reuse_files must be true or false (got {prf})")
+
+        # pool_pin_threads
+        ppt = section.get('pool_pin_threads')
+        if ppt is not None and not isinstance(ppt, bool):
+            errors.append(f"[{label}] pool_pin_threads must be true or false (got {ppt})")
+
+        # pool_sweep
+        ps = section.get('pool_sweep')
+        if ps is not None and ps not in ('full', 'fast'):
+            errors.append(f"[{label}] pool_sweep must be full or fast (got {ps})")
+
+        # pool_max_threads
+        pmt = section.get('pool_max_threads')
+        if pmt is not None and (not isinstance(pmt, int) or pmt < 0):
+            errors.append(f"[{label}] pool_max_threads must be 0 or more (got {pmt})")
+
+        # pool_stop_at_plateau
+        psp = section.get('pool_stop_at_plateau')
+        if psp is not None and not isinstance(psp, bool):
+            errors.append(f"[{label}] pool_stop_at_plateau must be true or false (got {psp})")
+
+        # pool_sync_depth
+        sd = section.get('pool_sync_depth')
+        if sd is not None and (not isinstance(sd, int) or not (0 <= sd <= 1024)):
+            errors.append(f"[{label}] pool_sync_depth must be 0-1024 (got {sd})")
+
+        # warmup_iterations
+        wi = section.get('warmup_iterations')
+        if wi is not None and (not isinstance(wi, int) or not (0 <= wi <= 10)):
+            errors.append(f"[{label}] warmup_iterations must be 0-10 (got {wi})")
+
         # retry_cleanup
         rc = section.get('retry_cleanup')
         if rc is not None and (not isinstance(rc, int) or rc < 0):
@@ -419,7 +535,7 @@ def _pre_run_dataset_safety_check(pool_name):
     """
     from core.dataset import get_datasets
 
-    dataset_name = f"{pool_name}/tn-bench"
+    dataset_name = bench_dataset_name(pool_name)
     datasets = get_datasets()
     if any(ds['name'] == dataset_name for ds in datasets):
         print_warning(f"Stale dataset found: {dataset_name} — cleaning up before run...")
@@ -561,7 +677,7 @@ def run_batch_config(args):
             "duration_seconds": 0,
         }
 
-        run_start = time.time()
+        run_start = time.monotonic()
 
         try:
             _execute_single_run(
@@ -581,11 +697,11 @@ def run_batch_config(args):
 
             if not continue_on_error:
                 print_error("Stopping batch — continue_on_error is false.")
-                run_record["duration_seconds"] = round(time.time() - run_start, 2)
+                run_record["duration_seconds"] = round(time.monotonic() - run_start, 2)
                 batch_summary["runs"].append(run_record)
                 break
 
-        run_record["duration_seconds"] = round(time.time() - run_start, 2)
+        run_record["duration_seconds"] = round(time.monotonic() - run_start, 2)
         batch_summary["runs"].append(run_record)
 
     # ── Finalize batch summary ───────────────────────────────────────
@@ -625,11 +741,26 @@ def _execute_single_run(merged, run_idx, run_name, args,
     zfs_iterations = merged.get('zfs_iterations', 2)
     disk_iterations = merged.get('disk_iterations', 0)
     pool_block_size = merged.get('pool_block_size', '1M')
+    pool_sync_depth = merged.get('pool_sync_depth', 0)
+    pool_engine = merged.get('pool_engine', 'python')
+    pool_direct_read = merged.get('pool_direct_read', False)
+    pool_direct_write = merged.get('pool_direct_write', False)
+    pool_drop_caches = merged.get('pool_drop_caches', False)
+    pool_stop_at_plateau = merged.get('pool_stop_at_plateau', False)
+    pool_data = merged.get('pool_data', 'random')
+    pool_zfs_send = merged.get('pool_zfs_send', False)
+    pool_overlap = merged.get('pool_overlap', False)
+    pool_reuse_files = merged.get('pool_reuse_files', False)
+    pool_pin_threads = merged.get('pool_pin_threads', False)
+    pool_sweep = merged.get('pool_sweep', 'full')
+    pool_max_threads = merged.get('pool_max_threads', 0)
+    pool_threads = min(cores, pool_max_threads) if pool_max_threads else cores
     disk_block_size_str = merged.get('disk_block_size', '1M')
     disk_modes = merged.get('disk_modes', ['serial'])
     if isinstance(disk_modes, str):
         disk_modes = [m.strip() for m in disk_modes.split(',')]
     seek_threads = merged.get('seek_threads', 4)
+    warmup_iterations = merged.get('warmup_iterations', 0)
     do_cleanup = merged.get('cleanup', True)
     verify_cleanup = merged.get('verify_cleanup', True)
     retry_cleanup = merged.get('retry_cleanup', 3)
@@ -651,7 +782,13 @@ def _execute_single_run(merged, run_idx, run_name, args,
         print_info("No pools selected for this run.")
 
     print_info(f"ZFS iterations: {zfs_iterations}, Pool block size: {pool_block_size}")
+    if pool_sync_depth:
+        print_info(f"Pool writers fdatasync every {pool_sync_depth} blocks")
+    if pool_threads < cores:
+        print_info(f"Pool benchmarks capped at {pool_threads} threads")
     print_info(f"Disk iterations: {disk_iterations}")
+    if warmup_iterations:
+        print_info(f"Warmup iterations: {warmup_iterations}")
     if disk_iterations > 0:
         print_info(f"Disk modes: {', '.join(disk_modes)}, Disk block size: {disk_block_size_str}")
 
@@ -672,11 +809,28 @@ def _execute_single_run(merged, run_idx, run_name, args,
             "zfs_iterations": zfs_iterations,
             "disk_iterations": disk_iterations,
             "pool_block_size": pool_block_size,
+            "pool_sync_depth": pool_sync_depth,
+            "pool_engine": pool_engine,
+            "pool_direct_read": pool_direct_read,
+            "pool_direct_write": pool_direct_write,
+            "pool_drop_caches": pool_drop_caches,
+            "pool_stop_at_plateau": pool_stop_at_plateau,
+            "pool_data": pool_data,
+            "pool_zfs_send": pool_zfs_send,
+            "pool_overlap": pool_overlap,
+            "pool_reuse_files": pool_reuse_files,
+            "pool_pin_threads": pool_pin_threads,
+            "pool_sweep": pool_sweep,
+            "pool_max_threads": pool_max_threads,
             "unattended": True,
             "batch_mode": True,
         }
     }
 
+    # Warmups change bytes written and comparability, so only note them when used
+    if warmup_iterations:
+        run_results["benchmark_config"]["warmup_iterations"] = warmup_iterations
+
     run_start_time = time.time()
 
     # ── ZFS pool benchmarks ──────────────────────────────────────────
@@ -685,7 +839,7 @@ def _execute_single_run(merged, run_idx, run_name, args,
             break
 
         pool_name = pool.get('name', 'N/A')
-        pool_start_time = time.time()
+        pool_start_time = time.monotonic()
 
         # Safety check: remove stale dataset if present
         if not _pre_run_dataset_safety_check(pool_name):
@@ -696,25 +850,39 @@ def _execute_single_run(merged, run_idx, run_name, args,
         dataset_path = create_dataset(pool_name, recordsize=pool_block_size)
 
         if dataset_path:
-            has_space, available_gib, required_gib = validate_space(pool_name, cores, zfs_iterations)
+            has_space, available_gib, required_gib = validate_space(pool_name, pool_threads, zfs_iterations,
+                                                                     overlap=pool_overlap)
 
             print_section("Space Verification")
             print_info(f"Available space: {available_gib:.2f} GiB")
-            print_info(f"Space required:  {required_gib:.2f} GiB (20 GiB/thread × {cores} threads)")
+            print_info(f"Space required:  {required_gib:.2f} GiB (20 GiB/thread × {pool_threads} threads)")
             print_info(f"Test iterations: {zfs_iterations} (space freed between iterations)")
 
             if not has_space:
-                print_error(f"Insufficient space in dataset {pool_name}/tn-bench")
-                _robust_dataset_cleanup(f"{pool_name}/tn-bench", retry_cleanup, force_cleanup, verify_cleanup)
+                print_error(f"Insufficient space in dataset {bench_dataset_name(pool_name)}")
+                _robust_dataset_cleanup(bench_dataset_name(pool_name), retry_cleanup, force_cleanup, verify_cleanup)
                 continue
 
             print_success("Sufficient space available — proceeding with benchmarks")
 
-            zfs_benchmark = ZFSPoolBenchmark(pool_name, cores, dataset_path, zfs_iterations, block_size=pool_block_size)
+            zfs_benchmark = ZFSPoolBenchmark(pool_name, pool_threads, dataset_path, zfs_iterations,
+                                             block_size=pool_block_size, warmup=warmup_iterations,
+                                             sync_depth=pool_sync_depth, engine=pool_engine,
+                                             direct_read=pool_direct_read,
+                                             direct_write=pool_direct_write,
+                                             drop_caches_before_read=pool_drop_caches,
+                                             stop_at_plateau=pool_stop_at_plateau,
+                                             data=pool_data,
+                                             zfs_send=pool_zfs_send,
+                                             overlap=pool_overlap,
+                                             reuse_files=pool_reuse_files,
+                                             pin_threads=pool_pin_threads,
+                                             sweep=pool_sweep,
+                                             dataset_name=bench_dataset_name(pool_name))
             pool_bench_results = zfs_benchmark.run()
             total_bytes_written = pool_bench_results["total_bytes_written"]
 
-            pool_end_time = time.time()
+            pool_end_time = time.monotonic()
             pool_duration = pool_end_time - pool_start_time
 
             pool_capacity_bytes = None
@@ -737,6 +905,7 @@ def _execute_single_run(merged, run_idx, run_name, args,
             for pool_entry in run_results["pools"]:
                 if pool_entry["name"] == pool_name:
                     pool_entry["benchmark_results"] = pool_bench_results["benchmark_results"]
+                    pool_entry["skipped_thread_counts"] = pool_bench_results.get("skipped_thread_counts", [])
                     pool_entry["total_writes_gib"] = total_writes_gib
                     pool_entry["dwpd"] = dwpd
                     pool_entry["benchmark_duration_seconds"] = pool_duration
@@ -765,7 +934,8 @@ def _execute_single_run(merged, run_idx, run_name, args,
                 test_mode=mode,
                 block_size=block_size_key,
                 iterations=disk_iterations,
-                seek_threads=seek_threads
+                seek_threads=seek_threads,
+                warmup=warmup_iterations
             )
             mode_results = disk_benchmark.run()
             all_disk_results.extend(mode_results)
@@ -778,7 +948,7 @@ def _execute_single_run(merged, run_idx, run_name, args,
     if do_cleanup and zfs_iterations > 0:
         for pool in selected_pools:
             pool_name = pool.get('name', 'N/A')
-            dataset_name = f"{pool_name}/tn-bench"
+            dataset_name = bench_dataset_name(pool_name)
             success = _robust_dataset_cleanup(
                 dataset_name,
                 retry_count=retry_cleanup,
@@ -1170,6 +1340,20 @@ def main():
         return
 
     unattended = args.unattended
+    warmup_iterations = args.warmup_iterations if args.warmup_iterations is not None else 0
+    pool_sync_depth = args.pool_sync_depth if args.pool_sync_depth is not None else 0
+    pool_engine = args.pool_engine or 'python'
+    pool_direct_read = args.pool_direct_read
+    pool_direct_write = args.pool_direct_write
+    pool_drop_caches = args.pool_drop_caches
+    pool_stop_at_plateau = args.pool_stop_at_plateau
+    pool_data = args.pool_data or 'random'
+    pool_zfs_send = args.pool_zfs_send
+    pool_overlap = args.pool_overlap
+    pool_reuse_files = args.pool_reuse_files
+    pool_pin_threads = args.pool_pin_threads
+    pool_sweep = args.pool_sweep or 'full'
+    pool_max_threads = args.pool_max_threads or 0
 
     # ── Validate unattended arguments ────────────────────────────────
     if unattended:
@@ -1194,10 +1378,27 @@ def main():
             "disk_benchmark_run": False,
             "zfs_iterations": 2,
             "disk_iterations": 2,
+            "pool_sync_depth": pool_sync_depth,
+            "pool_engine": pool_engine,
+            "pool_direct_read": pool_direct_read,
+            "pool_direct_write": pool_direct_write,
+            "pool_drop_caches": pool_drop_caches,
+            "pool_stop_at_plateau": pool_stop_at_plateau,
+            "pool_data": pool_data,
+            "pool_zfs_send": pool_zfs_send,
+            "pool_overlap": pool_overlap,
+            "pool_reuse_files": pool_reuse_files,
+            "pool_pin_threads": pool_pin_threads,
+            "pool_sweep": pool_sweep,
+            "pool_max_threads": pool_max_threads,
             "unattended": unattended
         }
     }
 
+    # Warmups change bytes written and comparability, so only note them when used
+    if warmup_iterations:
+        benchmark_results["benchmark_config"]["warmup_iterations"] = warmup_iterations
+
     # ── Confirmation ─────────────────────────────────────────────────
     if unattended:
         show_welcome_banner()
@@ -1309,10 +1510,13 @@ def main():
     cores = system_info.get("cores", 1)
 
     # ── Print config summary ─────────────────────────────────────────
-    print_header("DD Benchmark Starting")
+    print_header("Pool Benchmark Starting")
     if unattended:
         print_info("Mode: UNATTENDED (all prompts skipped)")
     print_info(f"Using {cores} threads for the benchmark.")
+    pool_threads = min(cores, pool_max_threads) if pool_max_threads else cores
+    if pool_threads < cores:
+        print_info(f"Pool benchmarks capped at {pool_threads} threads")
     
     if zfs_iterations > 0:
         print_info(f"ZFS tests will run {zfs_iterations} time(s) per configuration")
@@ -1330,38 +1534,52 @@ def main():
             break
             
         pool_name = pool.get('name', 'N/A')
-        pool_start_time = time.time()
+        pool_start_time = time.monotonic()
         print_header(f"Testing Pool: {pool_name}")
         print_info(f"Creating test dataset for pool: {pool_name} (recordsize={pool_block_size})")
         dataset_path = create_dataset(pool_name, recordsize=pool_block_size)
         
         if dataset_path:
             # Check available space
-            has_space, available_gib, required_gib = validate_space(pool_name, cores, zfs_iterations)
+            has_space, available_gib, required_gib = validate_space(pool_name, pool_threads, zfs_iterations,
+                                                                     overlap=pool_overlap)
             
             print_section("Space Verification")
             print_info(f"Available space: {available_gib:.2f} GiB")
-            print_info(f"Space required:  {required_gib:.2f} GiB (20 GiB/thread × {cores} threads)")
+            print_info(f"Space required:  {required_gib:.2f} GiB (20 GiB/thread × {pool_threads} threads)")
             print_info(f"Test iterations: {zfs_iterations} (space freed between iterations)")
             
             if not has_space:
-                print_error(f"Insufficient space in dataset {pool_name}/tn-bench")
+                print_error(f"Insufficient space in dataset {bench_dataset_name(pool_name)}")
                 print_error(f"Minimum required: {required_gib} GiB")
                 print_error(f"Available:        {available_gib:.2f} GiB")
                 print_info(f"Skipping benchmarks for pool {pool_name}")
-                delete_dataset(f"{pool_name}/tn-bench")
+                delete_dataset(bench_dataset_name(pool_name))
                 continue
 
             print_success("Sufficient space available - proceeding with benchmarks")
             
             # Run ZFS pool benchmark using the modular benchmark class
-            zfs_benchmark = ZFSPoolBenchmark(pool_name, cores, dataset_path, zfs_iterations, block_size=pool_block_size)
+            zfs_benchmark = ZFSPoolBenchmark(pool_name, pool_threads, dataset_path, zfs_iterations,
+                                             block_size=pool_block_size, warmup=warmup_iterations,
+                                             sync_depth=pool_sync_depth, engine=pool_engine,
+                                             direct_read=pool_direct_read,
+                                             direct_write=pool_direct_write,
+                                             drop_caches_before_read=pool_drop_caches,
+                                             stop_at_plateau=pool_stop_at_plateau,
+                                             data=pool_data,
+                                             zfs_send=pool_zfs_send,
+                                             overlap=pool_overlap,
+                                             reuse_files=pool_reuse_files,
+                                             pin_threads=pool_pin_threads,
+                                             sweep=pool_sweep,
+                                             dataset_name=bench_dataset_name(pool_name))
             pool_bench_results = zfs_benchmark.run()
             total_bytes_written = pool_bench_results["total_bytes_written"]
             iostat_telemetry = pool_bench_results.get("zpool_iostat_telemetry")
             arcstat_telemetry = pool_bench_results.get("arcstat_telemetry")
             
-            pool_end_time = time.time()
+            pool_end_time = time.monotonic()
             pool_duration = pool_end_time - pool_start_time
             
             # Get pool capacity for DWPD calculation
@@ -1388,6 +1606,7 @@ def main():
             for pool_entry in benchmark_results["pools"]:
                 if pool_entry["name"] == pool_name:
                     pool_entry["benchmark_results"] = pool_bench_results["benchmark_results"]
+                    pool_entry["skipped_thread_counts"] = pool_bench_results.get("skipped_thread_counts", [])
                     pool_entry["total_writes_gib"] = total_writes_gib
                     pool_entry["dwpd"] = dwpd
                     pool_entry["benchmark_duration_seconds"] = pool_duration
@@ -1416,7 +1635,8 @@ def main():
                 test_mode=mode,
                 block_size=block_size,
                 iterations=disk_iterations,
-                seek_threads=seek_threads
+                seek_threads=seek_threads,
+                warmup=warmup_iterations
             )
             mode_results = disk_benchmark.run()
             all_disk_results.extend(mode_results)
@@ -1437,7 +1657,7 @@ def main():
             break
             
         pool_name = pool.get('name', 'N/A')
-        dataset_name = f"{pool_name}/tn-bench"
+        dataset_name = bench_dataset_name(pool_name)
 
         if unattended:
             # In unattended mode: default to cleanup unless --cleanup no
@@ -4,6 +4,7 @@ Common utilities for formatting, colors, and helper functions.
 """
 
 import sys
+from functools import lru_cache
 
 # ANSI color codes
 COLORS = {
@@ -19,41 +20,40 @@ COLORS = {
 }
 
 
+@lru_cache(maxsize=4)
+def _isatty(stream):
+    """stream.isatty(), asked once per stream (each call is an ioctl)."""
+    return stream.isatty()
+
+
 def color_text(text, color_name):
     """Apply color to text if output is a terminal"""
-    if sys.stdout.isatty() and color_name in COLORS:
+    if color_name in COLORS and _isatty(sys.stdout):
         return f"{COLORS[color_name]}{text}{COLORS['ENDC']}"
     return text
 
 
+def _print_block(*lines):
+    """Print lines framed by blank lines as a single write."""
+    print("\n".join(("", *lines, "")))
+
+
 def print_header(title):
     """Print a formatted header with separators"""
-    separator = "#" * 60
-    print()
-    print(color_text(separator, "BLUE"))
-    print(color_text(f"# {title.center(56)} #", "BOLD"))
-    print(color_text(separator, "BLUE"))
-    print()
+    separator = color_text("#" * 60, "BLUE")
+    _print_block(separator, color_text(f"# {title.center(56)} #", "BOLD"), separator)
 
 
 def print_subheader(title):
     """Print a subheader with separators"""
-    separator = "-" * 60
-    print()
-    print(color_text(separator, "CYAN"))
-    print(color_text(f"| {title.center(56)} |", "BOLD"))
-    print(color_text(separator, "CYAN"))
-    print()
+    separator = color_text("-" * 60, "CYAN")
+    _print_block(separator, color_text(f"| {title.center(56)} |", "BOLD"), separator)
 
 
 def print_section(title):
     """Print a section separator"""
-    separator = "=" * 60
-    print()
-    print(color_text(separator, "GREEN"))
-    print(color_text(f" {title} ", "BOLD"))
-    print(color_text(separator, "GREEN"))
-    print()
+    separator = color_text("=" * 60, "GREEN")
+    _print_block(separator, color_text(f" {title} ", "BOLD"), separator)
 
 
 def print_warning(message):
@@ -0,0 +1,194 @@
+"""
+fio engine for tn-bench pool benchmarks.
+
+One fio process drives every worker of a phase -- one job section per
+file, aggregated with group_reporting -- so no Python thread or process is
+spawned per worker, and fio's own bandwidth accounting is what gets
+reported.
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+
+from utils.raw_io import NS_PER_SEC
+
+# Requests queued and reaped per batch. fio's default of 1 costs a
+# submit/getevents call per request under libaio; 8-32 keeps the queue
+# deep without the latency bursts of very large batches
+IO_BATCH = 16
+BATCH_OPTIONS = (
+    f"iodepth_batch_submit={IO_BATCH}",
+    f"iodepth_batch_complete_max={IO_BATCH}",
+)
+
+# io_uring shares submission/completion rings with the kernel, and
+# registered files/buffers skip the per-request fd and page lookups.
+# sqthread_poll is left off: it busy-polls a kernel thread per job, taking
+# CPUs from the ZFS pipeline being measured, and needs root before 5.11
+IO_URING_OPTIONS = (
+    "ioengine=io_uring",
+    "iodepth=64",
+    "registerfiles=1",
+    "fixedbufs=1",
+    *BATCH_OPTIONS,
+)
+LIBAIO_OPTIONS = (
+    "ioengine=libaio",
+    "iodepth=32",
+    *BATCH_OPTIONS,
+)
+
+
+def fio_available():
+    """Return True if an fio binary is on PATH."""
+    return shutil.which("fio") is not None
+
+
+def _kernel_version():
+    """(major, minor) of the running kernel, or (0, 0) if it can't be parsed."""
+    try:
+        major, minor = platform.release().split(".")[:2]
+        return int(major), int(minor.split("-")[0])
+    except ValueError:
+        return 0, 0
+
+
+@lru_cache(maxsize=None)
+def engine_options():
+    """
+    Pick fio ioengine settings for this system.
+
+    io_uring needs Linux 5.1+ and an fio built with it; anything else
+    gets libaio.
+
+    Returns:
+        tuple: Job file lines for the [global] section
+    """
+    if platform.system() != "Linux" or _kernel_version() < (5, 1):
+        return LIBAIO_OPTIONS
+    try:
+        probe = subprocess.run(["fio", "--enghelp=io_uring"], capture_output=True)
+    except OSError:
+        return LIBAIO_OPTIONS
+    return IO_URING_OPTIONS if probe.returncode == 0 else LIBAIO_OPTIONS
+
+
+def allowed_cpus():
+    """CPUs this process may run on, in order, or None where affinity is unsupported."""
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    return sorted(os.sched_getaffinity(0))
+
+
+def _job_filename(path):
+    """Escape a path for fio's filename option, where ':' separates files."""
+    return path.replace(":", "\\:")
+
+
+def build_jobfile(rw, paths, size_bytes, block_bytes, sync_blocks=0, direct=False,
+                  zero_buffers=False, pin_cpus=False, cpu_offset=0):
+    """
+    Render an fio job file with one job per path.
+
+    Args:
+        rw: "write" or "read"
+        paths: One file per concurrent worker
+        size_bytes: Bytes each worker moves
+        block_bytes: Request size in bytes
+        sync_blocks: Writes between fdatasync() calls (0 = never sync)
+        direct: Use O_DIRECT so the ARC is bypassed
+        zero_buffers: Write zeros instead of fio's random buffer contents
+        pin_cpus: Give each job its own CPU from the allowed set
+        cpu_offset: Rotate the CPU list so pinning starts this many CPUs in
+
+    Returns:
+        str: Job file contents
+    """
+    lines = [
+        "[global]",
+        f"rw={rw}",
+        f"bs={block_bytes}",
+        f"size={size_bytes}",
+        *engine_options(),
+        # Buffered unless asked otherwise, like the in-process engine
+        f"direct={int(direct)}",
+        "randrepeat=0",
+        "group_reporting=1",
+    ]
+    if rw == "write" and sync_blocks:
+        lines.append(f"fdatasync={sync_blocks}")
+    if rw == "write" and zero_buffers:
+        lines.append("zero_buffers=1")
+    # Each job gets its own CPU, wrapping; named per job rather than with
+    # cpus_allowed_policy=split, which always starts from the lowest CPU
+    cpus = allowed_cpus() if pin_cpus else None
+    for index, path in enumerate(paths):
+        lines += ["", f"[{rw}{index}]", f"filename={_job_filename(path)}"]
+        if cpus:
+            lines.append(f"cpus_allowed={cpus[(cpu_offset + index) % len(cpus)]}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_output(stdout, rw, stderr=""):
+    """
+    Pull aggregate bytes and elapsed time out of fio's JSON output.
+
+    stderr is only used to explain output that holds no JSON report.
+
+    Returns:
+        tuple: (io_bytes, elapsed_ns), with elapsed_ns derived from fio's
+               bw_bytes so that bytes / time reproduces fio's bandwidth
+    """
+    # Some fio versions print notices ahead of the JSON document
+    start = stdout.find("{")
+    if start < 0:
+        raise RuntimeError(f"fio {rw} printed no JSON report: {stderr.strip() or stdout.strip()}")
+    report = json.loads(stdout[start:])
+    stats = report["jobs"][0][rw]
+    io_bytes = stats["io_bytes"]
+    bw_bytes = stats["bw_bytes"]
+    if not bw_bytes:
+        return io_bytes, 0
+    return io_bytes, io_bytes * NS_PER_SEC // bw_bytes
+
+
+def run_fio(rw, paths, size_bytes, block_bytes, sync_blocks=0, direct=False,
+            zero_buffers=False, pin_cpus=False, cpu_offset=0):
+    """
+    Run one fio phase across all paths at once.
+
+    Args:
+        rw: "write" or "read"
+        paths: One file per concurrent worker
+        size_bytes: Bytes each worker moves
+        block_bytes: Request size in bytes
+        sync_blocks: Writes between fdatasync() calls (0 = never sync)
+        direct: Use O_DIRECT so the ARC is bypassed
+        zero_buffers: Write zeros instead of fio's random buffer contents
+        pin_cpus: Give each job its own CPU from the allowed set
+        cpu_offset: Rotate the CPU list so pinning starts this many CPUs in
+
+    Returns:
+        tuple: (total bytes moved, elapsed nanoseconds)
+
+    Raises:
+        RuntimeError: If fio exits non-zero or prints no JSON report
+    """
+    jobfile = build_jobfile(rw, paths, size_bytes, block_bytes, sync_blocks, direct, zero_buffers,
+                            pin_cpus, cpu_offset)
+    with tempfile.NamedTemporaryFile("w", prefix="tn-bench-", suffix=".fio", delete=False) as f:
+        f.write(jobfile)
+    try:
+        result = subprocess.run(
+            ["fio", "--output-format=json", f.name], capture_output=True, text=True
+        )
+    finally:
+        os.unlink(f.name)
+    if result.returncode != 0:
+        raise RuntimeError(f"fio {rw} failed: {result.stderr.strip() or result.stdout.strip()}")
+    return parse_output(result.stdout, rw, result.stderr)
@@ -0,0 +1,79 @@
+"""
+Per-request latency histogram for tn-bench disk benchmarks.
+
+Log-linear buckets (16 per power of two) keep memory constant however many
+reads are recorded, with quantiles accurate to about 6%. Histograms from
+several workers or runs merge by adding counts.
+"""
+
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+# 64 powers of two covers any nanosecond duration
+NUM_BUCKETS = 64 * SUB_BUCKETS
+
+
+def _bucket_index(ns):
+    """Map a duration in nanoseconds to its bucket."""
+    if ns < SUB_BUCKETS:
+        return max(ns, 0)
+    shift = ns.bit_length() - SUB_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (ns >> shift) - SUB_BUCKETS
+
+
+def _bucket_midpoint(index):
+    """Representative duration (ns) for a bucket."""
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return low + ((1 << shift) - 1) / 2
+
+
+class LatencyHistogram:
+    """
+    Mergeable latency histogram.
+
+    Usage:
+        hist = LatencyHistogram()
+        hist.record(elapsed_ns)
+        p99_us = hist.percentile(99) / 1000
+    """
+
+    def __init__(self):
+        self.counts = [0] * NUM_BUCKETS
+        self.total = 0
+
+    def record(self, ns):
+        """Add one latency sample, in nanoseconds."""
+        self.counts[_bucket_index(ns)] += 1
+        self.total += 1
+
+    def merge(self, other):
+        """Add every sample from another histogram into this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        return self
+
+    def percentile(self, pct):
+        """
+        Latency at the given percentile.
+
+        Args:
+            pct: Percentile in [0, 100]
+
+        Returns:
+            float: Latency in nanoseconds, or 0.0 if nothing was recorded
+        """
+        if not self.total:
+            return 0.0
+        target = max(1, -(-self.total * pct // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return float(_bucket_midpoint(index))
+        return float(_bucket_midpoint(NUM_BUCKETS - 1))
+
+    def summary_us(self, percentiles=(50, 90, 99)):
+        """Return {"p50": ..., "p90": ..., "p99": ...} in microseconds (JSON friendly)."""
+        return {f"p{p}": round(self.percentile(p) / 1000, 1) for p in percentiles}
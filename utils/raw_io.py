@@ -0,0 +1,340 @@
+"""
+In-process I/O helpers shared by the tn-bench benchmarks.
+
+Pool test data is moved with sendfile() so the copy stays inside the kernel
+and no dd or shell process is spawned per worker; disks are read with
+O_DIRECT into a page-aligned buffer so every iteration measures the device
+rather than the kernel page cache. All timings are integer nanoseconds from
+perf_counter_ns() and are turned into MiB/s by mib_per_sec().
+"""
+
+import errno
+import mmap
+import os
+import subprocess
+import tempfile
+import time
+
+MIB = 1 << 20
+NS_PER_SEC = 1_000_000_000
+
+# Default seed size: big enough that consecutive records differ, small
+# enough to generate in well under a second
+SEED_BYTES = 128 * MIB
+
+# direct_read() times one request in this many when recording latency;
+# timing every request costs two clock reads and a Python call inside the
+# throughput window, which shows at 4K
+LATENCY_SAMPLE_EVERY = 64
+
+# O_DIRECT / O_NOATIME are Linux-only flags; default to 0 elsewhere
+O_DIRECT = getattr(os, "O_DIRECT", 0)
+O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def mib_per_sec(nbytes, elapsed_ns):
+    """
+    Convert a byte count and elapsed nanoseconds into MiB/s.
+
+    Returns:
+        float: Throughput in MiB/s, or 0.0 if no time elapsed
+    """
+    if elapsed_ns <= 0:
+        return 0.0
+    # Integer bytes/s first; the only float division is the MiB conversion
+    return nbytes * NS_PER_SEC // elapsed_ns / MIB
+
+
+def create_seed_fd(size_bytes=SEED_BYTES, chunk=MIB, random_data=True):
+    """
+    Create a readable file descriptor holding size_bytes of seed data.
+
+    The data comes from os.urandom once, up front, so writers never wait on
+    the kernel CSPRNG. Uses an anonymous memfd where available, otherwise an
+    unlinked temp file.
+
+    Args:
+        size_bytes: Seed size (a multiple of every block size writers use)
+        chunk: Bytes generated per os.urandom call
+        random_data: False for an all-zero seed, which costs nothing to build
+
+    Returns:
+        int: File descriptor positioned at offset 0; caller closes it
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("tn-bench-seed")
+    else:
+        with tempfile.TemporaryFile() as tmp:
+            fd = os.dup(tmp.fileno())
+    if not random_data:
+        os.ftruncate(fd, size_bytes)
+        return fd
+    for start in range(0, size_bytes, chunk):
+        os.write(fd, os.urandom(min(chunk, size_bytes - start)))
+    os.lseek(fd, 0, os.SEEK_SET)
+    return fd
+
+
+def preallocate_file(path, size_bytes):
+    """
+    Create path (truncating it) and reserve size_bytes up front.
+
+    Uses posix_fallocate() where the filesystem supports it and otherwise
+    just sets the final size with ftruncate(), so the timed write does not
+    grow the file extent by extent. On ZFS either call is only a hint:
+    copy-on-write still allocates blocks as they are written.
+
+    Args:
+        path: File to create
+        size_bytes: Final file size
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            os.posix_fallocate(fd, 0, size_bytes)
+        except (AttributeError, OSError):
+            os.ftruncate(fd, size_bytes)
+    finally:
+        os.close(fd)
+
+
+def write_file(path, src_fd, total_bytes, chunk=1 << 20, sync_bytes=0, seed_offset=0,
+               truncate=True, direct=False):
+    """
+    Fill path with total_bytes by sendfile()ing the seed, wrapping at its end.
+
+    sendfile() takes an explicit offset and never moves the seed's file
+    position, so one seed fd can be shared by any number of concurrent
+    writers; giving each a different seed_offset keeps their files from
+    being block-for-block identical. copy_file_range() is deliberately not
+    used: with the seed on the pool, OpenZFS 2.2+ would block-clone it and
+    report a meaningless write speed, and from the memfd seed it either
+    fails with EXDEV or takes the same in-kernel splice path as sendfile().
+    With sync_bytes set, the file is
+    fdatasync()ed after every sync_bytes and once more at the end; the call
+    releases the GIL, so concurrent writers keep their syncs in flight
+    together and the ZIL/SLOG sees real parallel commit load.
+
+    With direct set the file is opened with O_DIRECT and each chunk is
+    copied from the seed into one page-aligned buffer, reused for every
+    write, then pwrite()n; sendfile() cannot target O_DIRECT files reliably.
+
+    Args:
+        path: File to create (truncated if it exists)
+        src_fd: Seed file descriptor from create_seed_fd()
+        total_bytes: Bytes to write
+        chunk: Bytes per sendfile() call (at most the seed size)
+        sync_bytes: Bytes between fdatasync() calls (0 = never sync)
+        seed_offset: Where in the seed this writer starts (multiple of chunk)
+        truncate: Empty the file first; pass False to overwrite a file
+                  prepared by preallocate_file()
+        direct: Bypass the page cache / ARC on write
+
+    Returns:
+        int: Bytes written
+    """
+    seed_bytes = os.fstat(src_fd).st_size
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if truncate else 0)
+    buf = None
+    if direct:
+        try:
+            fd = os.open(path, flags | O_DIRECT, 0o644)
+        except OSError:
+            # Filesystem refuses O_DIRECT; same code path, buffered
+            fd = os.open(path, flags, 0o644)
+        buf = mmap.mmap(-1, chunk)
+    else:
+        fd = os.open(path, flags, 0o644)
+    written = 0
+    unsynced = 0
+    try:
+        while written < total_bytes:
+            position = (seed_offset + written) % seed_bytes
+            count = min(chunk, total_bytes - written, seed_bytes - position)
+            if buf is None:
+                n = os.sendfile(fd, src_fd, position, count)
+            elif count == chunk:
+                os.preadv(src_fd, [buf], position)
+                n = os.pwrite(fd, buf, written)
+            else:
+                # Partial chunk, only if total_bytes is not a multiple of chunk;
+                # O_DIRECT may reject it as unaligned
+                n = os.pwrite(fd, os.pread(src_fd, count, position), written)
+            if n <= 0:
+                break
+            written += n
+            unsynced += n
+            if sync_bytes and unsynced >= sync_bytes:
+                os.fdatasync(fd)
+                unsynced = 0
+        if sync_bytes and unsynced:
+            os.fdatasync(fd)
+    finally:
+        os.close(fd)
+        if buf is not None:
+            buf.close()
+    return written
+
+
+def read_file(path, chunk=1 << 20, direct=False):
+    """
+    Read path to EOF, discarding the data into /dev/null via sendfile().
+
+    With direct set the file is read with O_DIRECT instead (see
+    direct_read()), so on OpenZFS 2.3+ the ARC neither serves nor keeps it.
+
+    Args:
+        path: File to read
+        chunk: Bytes per sendfile() call, or per read when direct
+        direct: Bypass the page cache / ARC
+
+    Returns:
+        int: Bytes read
+    """
+    if direct:
+        return direct_read(path, os.path.getsize(path), chunk)[0]
+    src = os.open(path, os.O_RDONLY)
+    null = os.open(os.devnull, os.O_WRONLY)
+    offset = 0
+    try:
+        while True:
+            n = os.sendfile(null, src, offset, chunk)
+            if n <= 0:
+                break
+            offset += n
+    finally:
+        os.close(null)
+        os.close(src)
+    return offset
+
+
+def _read_positions(fd, buf, positions):
+    """
+    preadv() one buffer's worth at each position in turn.
+
+    Returns:
+        tuple: (bytes_read, hit_end) -- hit_end is True if a read returned nothing
+    """
+    bytes_read = 0
+    for position in positions:
+        n = os.preadv(fd, [buf], position)
+        if n <= 0:
+            return bytes_read, True
+        bytes_read += n
+    return bytes_read, False
+
+
+def _open_direct(path):
+    """Open path read-only with O_DIRECT, adding O_NOATIME when the kernel allows it."""
+    try:
+        return os.open(path, os.O_RDONLY | O_DIRECT | O_NOATIME)
+    except OSError as e:
+        # O_NOATIME is refused with EPERM unless we own the file
+        if e.errno != errno.EPERM or not O_NOATIME:
+            raise
+    return os.open(path, os.O_RDONLY | O_DIRECT)
+
+
+def opens_direct(path):
+    """Return True if path can be opened with O_DIRECT, so direct_read() bypasses the page cache."""
+    if not O_DIRECT:
+        return False
+    try:
+        fd = _open_direct(path)
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
+def direct_read(path, size_bytes, block_bytes, offset=0, histogram=None):
+    """
+    Read up to size_bytes sequentially from offset, bypassing the page cache.
+
+    Paths that reject O_DIRECT are read buffered with fadvise hints instead.
+
+    Args:
+        path: Device or file path (e.g. "/dev/sda")
+        size_bytes: Number of bytes to read
+        block_bytes: Size of each read request in bytes (multiple of 4 KiB)
+        offset: Starting byte offset (multiple of block_bytes)
+        histogram: Optional LatencyHistogram that receives the latency of one
+                   request in every LATENCY_SAMPLE_EVERY
+
+    Returns:
+        tuple: (bytes_read, elapsed_ns) -- elapsed time in integer nanoseconds
+    """
+    # Anonymous mmap is page-aligned, which satisfies O_DIRECT alignment rules
+    buf = mmap.mmap(-1, block_bytes)
+    count = size_bytes // block_bytes
+    bytes_read = 0
+
+    positions = range(offset, offset + count * block_bytes, block_bytes)
+
+    fd = None
+    if O_DIRECT:
+        try:
+            fd = _open_direct(path)
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+    if fd is None:
+        # zvols, loop images and some filesystems refuse O_DIRECT (EINVAL);
+        # read buffered but describe the access pattern and ask not to keep pages
+        fd = os.open(path, os.O_RDONLY)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, offset, size_bytes, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, offset, size_bytes, os.POSIX_FADV_NOREUSE)
+    try:
+        start_ns = time.perf_counter_ns()
+        if histogram is None:
+            bytes_read = _read_positions(fd, buf, positions)[0]
+        else:
+            # Time the first request of each stride; the rest go through the
+            # same untimed loop as above
+            clock = time.perf_counter_ns
+            for first in range(0, count, LATENCY_SAMPLE_EVERY):
+                request_ns = clock()
+                n = os.preadv(fd, [buf], positions[first])
+                histogram.record(clock() - request_ns)
+                if n <= 0:
+                    break
+                bytes_read += n
+                n, hit_end = _read_positions(fd, buf, positions[first + 1:first + LATENCY_SAMPLE_EVERY])
+                bytes_read += n
+                if hit_end:
+                    break
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        # Drop anything the page cache picked up along the way
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, offset, size_bytes, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+        buf.close()
+
+    return bytes_read, elapsed_ns
+
+
+def drop_caches():
+    """
+    Flush dirty pages and drop the page cache, dentries and inodes.
+
+    On ZFS this also asks the ARC to shrink. Writing to /proc requires root;
+    falls back to sysctl if the direct write is refused.
+
+    Returns:
+        bool: True if the caches were dropped
+    """
+    os.sync()
+    try:
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except OSError:
+        pass
+
+    try:
+        result = subprocess.run(["sysctl", "-w", "vm.drop_caches=3"], capture_output=True)
+        return result.returncode == 0
+    except OSError:
+        return False